@@ -30,8 +30,8 @@ function print_info {
 }
 
 function print_error {
-    # Red color
-    echo -e "\033[0;31m$1\033[0m"
+    # Red color, on stderr
+    echo -e "\033[0;31m$1\033[0m" >&2
 }
 
 
@@ -81,8 +81,11 @@ print_info "Creating .axiom directory structure..."
 mkdir -p ".axiom/meta"
 mkdir -p ".axiom/cache"
 
-# 7. Run initial metadata scan if Python is available
-if command -v python3 &> /dev/null && [ -f "scripts/axiom-meta-generator.py" ]; then
+# 7. Run initial metadata scan if Python is available and it was not opted out of
+if [ -n "$AXIOM_SKIP_INITIAL_SCAN" ]; then
+    print_info "AXIOM_SKIP_INITIAL_SCAN is set. Skipping initial scan."
+    print_info "You can run the scan manually later with: python3 scripts/axiom-meta-generator.py --scan"
+elif command -v python3 &> /dev/null && [ -f "scripts/axiom-meta-generator.py" ]; then
     print_info "Running initial metadata scan..."
     python3 scripts/axiom-meta-generator.py --init --scan
     if [ $? -eq 0 ]; then
@@ -109,6 +112,7 @@ echo "  .axiom/               # AI-optimized metadata directory"
 echo "  .axiom/meta/          # File-specific metadata"
 echo "  .axiom/cache/         # AI caching and optimization"
 echo "  .axiom/index.yml      # Project-wide AI context"
+echo "  .axiom/index.json     # Same index as JSON, for tools"
 echo "  scripts/              # Axiom management scripts"
 echo ""
 print_info "Next steps:"
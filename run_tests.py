@@ -6,10 +6,16 @@ Provides convenient test execution with different options.
 
 import os
 import sys
+import shutil
 import argparse
 import subprocess
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
+# Run pytest through pytest-xdist when available (disabled with --no-parallel)
+PARALLEL = True
+
 
 def run_command(cmd, description=""):
     """Run a command and return success status."""
@@ -32,21 +38,54 @@ def run_command(cmd, description=""):
         return False
 
 
+# Modules the suite needs from the interpreter that runs it
+TEST_MODULES = ("pytest", "yaml", "xdist")
+
+
+@lru_cache(maxsize=None)
+def missing_test_modules():
+    """Return the TEST_MODULES that the python3 running the tests can't import.
+    
+    That is this interpreter unless PATH resolves python3 elsewhere (e.g. outside
+    the active venv); only then is the other one asked, in a single probe.
+    """
+    python3 = shutil.which("python3")
+    if python3 is None or os.path.realpath(python3) == os.path.realpath(sys.executable):
+        return frozenset(name for name in TEST_MODULES if importlib.util.find_spec(name) is None)
+    probe = ("import importlib.util as u; "
+             f"print(*[m for m in {TEST_MODULES!r} if u.find_spec(m) is None])")
+    try:
+        result = subprocess.run([python3, "-c", probe], capture_output=True, text=True)
+    except OSError:
+        return frozenset(TEST_MODULES)
+    if result.returncode != 0:
+        return frozenset(TEST_MODULES)
+    return frozenset(result.stdout.split())
+
+
+def xdist_args(dist="load"):
+    """Return pytest-xdist arguments for the current run, if parallel runs are enabled."""
+    if not PARALLEL or "xdist" in missing_test_modules():
+        return []
+    return ["-n", str(os.cpu_count() or 2), f"--dist={dist}"]
+
+
 def check_dependencies():
     """Check that required dependencies are available."""
     print("Checking dependencies...")
     
+    # Tests run as "python3 -m pytest" and the scripts import yaml
     dependencies = [
-        ("python3", "Python 3"),
-        ("pytest", "Pytest testing framework")
+        ("Python 3", lambda: shutil.which("python3") is not None),
+        ("Pytest testing framework", lambda: "pytest" not in missing_test_modules()),
+        ("PyYAML", lambda: "yaml" not in missing_test_modules())
     ]
     
     missing = []
-    for cmd, name in dependencies:
-        try:
-            subprocess.run([cmd, "--version"], capture_output=True, check=True)
+    for name, available in dependencies:
+        if available():
             print(f"✅ {name} is available")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             print(f"❌ {name} is missing")
             missing.append(name)
     
@@ -63,7 +102,8 @@ def install_test_dependencies():
     print("Installing test dependencies...")
     
     # Install pytest and other test dependencies
-    cmd = [sys.executable, "-m", "pip", "install", "pytest", "pyyaml"]
+    # Into the python3 that runs the tests, which check_dependencies looks at
+    cmd = ["python3", "-m", "pip", "install", "pytest", "pytest-xdist", "pyyaml", "xxhash", "orjson"]
     return run_command(cmd, "Installing pytest and dependencies")
 
 
@@ -72,7 +112,8 @@ def run_unit_tests():
     cmd = [
         "python3", "-m", "pytest", 
         "tests/test_axiom_meta_generator.py",
-        "-v", "--tb=short"
+        "-v", "--tb=short",
+        *xdist_args()
     ]
     return run_command(cmd, "Unit tests for axiom meta generator")
 
@@ -82,7 +123,10 @@ def run_script_tests():
     cmd = [
         "python3", "-m", "pytest",
         "tests/test_init_axiom_script.py",
-        "-v", "--tb=short"
+        "-v", "--tb=short",
+        # Nothing here uses --lf/--sw, so skip the .pytest_cache reads and writes
+        "-p", "no:cacheprovider", "-p", "no:stepwise",
+        *xdist_args()
     ]
     return run_command(cmd, "Integration tests for init script")
 
@@ -92,7 +136,8 @@ def run_command_tests():
     cmd = [
         "python3", "-m", "pytest",
         "tests/test_claude_commands.py", 
-        "-v", "--tb=short"
+        "-v", "--tb=short",
+        *xdist_args()
     ]
     return run_command(cmd, "Tests for Claude slash commands")
 
@@ -102,17 +147,20 @@ def run_e2e_tests():
     cmd = [
         "python3", "-m", "pytest",
         "tests/test_end_to_end_workflow.py",
-        "-v", "--tb=short", "--maxfail=3"
+        "-v", "--tb=short", "--maxfail=3",
+        # Each test owns its project directory, so tests spread across workers freely
+        *xdist_args()
     ]
     return run_command(cmd, "End-to-end workflow tests")
 
 
 def run_all_tests():
-    """Run all tests."""
+    """Run all test suites in a single pytest session."""
     cmd = [
         "python3", "-m", "pytest",
         "tests/",
-        "-v", "--tb=short"
+        "-v", "--tb=short",
+        *xdist_args(dist="loadfile")
     ]
     return run_command(cmd, "All tests")
 
@@ -123,7 +171,8 @@ def run_fast_tests():
         "python3", "-m", "pytest", 
         "tests/",
         "-v", "--tb=short",
-        "-m", "not slow and not e2e"
+        "-m", "not slow and not e2e",
+        *xdist_args()
     ]
     return run_command(cmd, "Fast tests only")
 
@@ -131,8 +180,8 @@ def run_fast_tests():
 def run_coverage_tests():
     """Run tests with coverage reporting."""
     # Install coverage if needed
-    subprocess.run([sys.executable, "-m", "pip", "install", "pytest-cov"], 
-                  capture_output=True)
+    subprocess.run(["python3", "-m", "pip", "install", "pytest-cov"],
+                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     cmd = [
         "python3", "-m", "pytest",
@@ -140,7 +189,8 @@ def run_coverage_tests():
         "--cov=scripts",
         "--cov-report=html",
         "--cov-report=term",
-        "-v"
+        "-v",
+        *xdist_args(dist="loadfile")
     ]
     return run_command(cmd, "Tests with coverage reporting")
 
@@ -151,7 +201,7 @@ def validate_init_script():
     
     # Create temporary test directory
     import tempfile
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
         original_cwd = os.getcwd()
         try:
             os.chdir(temp_dir)
@@ -199,45 +249,53 @@ def validate_init_script():
             os.chdir(original_cwd)
 
 
+def load_meta_generator():
+    """Import scripts/axiom-meta-generator.py as the axiom_meta_generator module."""
+    script_path = Path(__file__).parent / "scripts" / "axiom-meta-generator.py"
+    spec = importlib.util.spec_from_file_location("axiom_meta_generator", script_path)
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so the scan's process pool can pickle its workers
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
 def validate_meta_generator():
-    """Validate the meta generator by running it on the project itself."""
+    """Validate the meta generator by running it in-process on a test project."""
     print("\nValidating axiom-meta-generator.py...")
     
-    # Run meta generator on current project
-    cmd = ["python3", "scripts/axiom-meta-generator.py", "--help"]
-    if not run_command(cmd, "Checking meta generator help"):
+    # Load the generator once instead of spawning a Python process per command
+    try:
+        generator_module = load_meta_generator()
+    except Exception as e:
+        print(f"❌ Could not load meta generator: {e}")
         return False
+    print("✅ Meta generator module loaded")
     
     # Test initialization
     import tempfile
-    with tempfile.TemporaryDirectory() as temp_dir:
-        original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        # Create test file
+        with open(Path(temp_dir) / "test.py", "w") as f:
+            f.write("def test(): pass\n")
+        
         try:
-            os.chdir(temp_dir)
-            
-            # Create test file
-            with open("test.py", "w") as f:
-                f.write("def test(): pass\n")
-            
-            # Test init
-            cmd = ["python3", str(Path(original_cwd) / "scripts" / "axiom-meta-generator.py"), "--init"]
-            if not run_command(cmd, "Testing meta generator init"):
-                return False
-            
-            # Test scan
-            cmd = ["python3", str(Path(original_cwd) / "scripts" / "axiom-meta-generator.py"), "--scan"]
-            success = run_command(cmd, "Testing meta generator scan")
-            
-            # Check results
-            if success and Path(".axiom/index.yml").exists():
-                print("✅ Meta generator validation successful")
-                return True
-            else:
-                print("❌ Meta generator validation failed")
-                return False
-                
-        finally:
-            os.chdir(original_cwd)
+            # Same steps as --init followed by --scan
+            generator = generator_module.AxiomMetaGenerator(temp_dir)
+            generator.init_axiom_structure()
+            stats = generator.scan_and_generate_meta()
+            generator.generate_index()
+        except Exception as e:
+            print(f"❌ Meta generator validation failed: {e}")
+            return False
+        
+        # Check results
+        if stats['total_files'] == 1 and (Path(temp_dir) / ".axiom" / "index.yml").exists():
+            print("✅ Meta generator validation successful")
+            return True
+        else:
+            print("❌ Meta generator validation failed")
+            return False
 
 
 def main():
@@ -263,9 +321,14 @@ def main():
                        help="Validate scripts by running them")
     parser.add_argument("--all", action="store_true", 
                        help="Run all tests (default)")
+    parser.add_argument("--no-parallel", action="store_true",
+                       help="Run tests serially instead of with pytest-xdist")
     
     args = parser.parse_args()
     
+    global PARALLEL
+    PARALLEL = not args.no_parallel
+    
     # Change to project root directory
     project_root = Path(__file__).parent
     os.chdir(project_root)
@@ -315,17 +378,10 @@ def main():
         success &= validate_init_script()
         success &= validate_meta_generator()
         
-        print("\n🧪 Unit Tests")
-        success &= run_unit_tests()
-        
-        print("\n📜 Script Integration Tests")
-        success &= run_script_tests()
-        
-        print("\n⚡ Command Tests")
-        success &= run_command_tests()
-        
-        print("\n🔄 End-to-End Tests")
-        success &= run_e2e_tests()
+        # One pytest session collects every suite at once instead of
+        # paying interpreter startup and collection once per suite
+        print("\n🧪 Test Suites")
+        success &= run_all_tests()
     
     # Final result
     print(f"\n{'='*60}")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Axiom Init - Python port of init-axiom.sh
+Initializes the Axiom Protocol in a project directory without spawning a shell.
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import contextlib
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, TextIO, Union
+
+# Templates are read from the checkout this script lives in, as init-axiom.sh does
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_TEMPLATE = SCRIPT_DIR / "templates" / "axiom" / "MANIFEST.yml.tpl"
+CLAUDE_COMMANDS_DIR = SCRIPT_DIR / ".claude" / "commands"
+CLAUDE_MD_TEMPLATE = SCRIPT_DIR / "CLAUDE_MD_FOR_USER.md"
+META_GENERATOR_SCRIPT = SCRIPT_DIR / "scripts" / "axiom-meta-generator.py"
+
+MANIFEST_OUTPUT = ".axiom-manifest.yml"
+CLAUDE_MD_OUTPUT = "CLAUDE.md"
+META_GENERATOR_OUTPUT = "scripts/axiom-meta-generator.py"
+# Same bytes `echo -e "$GITIGNORE_ENTRY" >> .gitignore` appends
+GITIGNORE_ENTRY = "\n# Axiom Protocol Files\n.axiom-manifest.yml\n*.contract.yml\n.axiom/\n\n"
+
+
+def print_success(message: str) -> None:
+    # Green color
+    print(f"\033[0;32m{message}\033[0m")
+
+
+def print_info(message: str) -> None:
+    # Blue color
+    print(f"\033[0;34m{message}\033[0m")
+
+
+def print_error(message: str) -> None:
+    # Red color
+    print(f"\033[0;31m{message}\033[0m", file=sys.stderr)
+
+
+def _current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def copy_file(src: Union[str, os.PathLike], dst: Union[str, os.PathLike], extra_mode: int = 0) -> None:
+    """Copy like cp: content only, with the source's mode bits (plus extra_mode) less the umask."""
+    shutil.copyfile(src, dst)
+    os.chmod(dst, (os.stat(src).st_mode | extra_mode) & 0o777 & ~_current_umask())
+
+
+def load_meta_generator() -> ModuleType:
+    """Return the meta generator module, importing scripts/axiom-meta-generator.py on first use."""
+    module = sys.modules.get("axiom_meta_generator")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("axiom_meta_generator", META_GENERATOR_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        # Register before executing so the scan's process pool can pickle its workers
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def run(target_dir: Union[str, os.PathLike] = ".", skip_scan: bool = False,
+        scan_output: Optional[TextIO] = None) -> int:
+    """Initialize the Axiom Protocol in target_dir and return the script's exit code.
+
+    skip_scan takes the path init-axiom.sh follows when python3 is not on PATH.
+    Setting AXIOM_SKIP_INITIAL_SCAN in the environment skips the scan too, as it does for the script.
+    The scan runs in this process; its progress goes to scan_output (default sys.stdout).
+    """
+    target = Path(target_dir)
+    print_info("Initializing Axiom Protocol for this project...")
+
+    # 1. Check if manifest already exists
+    manifest_output = target / MANIFEST_OUTPUT
+    if manifest_output.is_file():
+        print_error("Error: .axiom-manifest.yml already exists. Initialization aborted.")
+        return 1
+
+    # 2. Copy the manifest template
+    if not MANIFEST_TEMPLATE.is_file():
+        print_error(f"Error: Manifest template not found at {MANIFEST_TEMPLATE}")
+        return 1
+    copy_file(MANIFEST_TEMPLATE, manifest_output)
+
+    # 3. Copy Claude commands if they exist
+    if CLAUDE_COMMANDS_DIR.is_dir():
+        commands_output = target / ".claude" / "commands"
+        for dirpath, dirnames, filenames in os.walk(CLAUDE_COMMANDS_DIR):
+            if dirpath == str(CLAUDE_COMMANDS_DIR):
+                # cp -r dir/* leaves out the top level's hidden entries, but not deeper ones
+                dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+                filenames = [name for name in filenames if not name.startswith('.')]
+            output_dir = commands_output / os.path.relpath(dirpath, CLAUDE_COMMANDS_DIR)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for name in filenames:
+                copy_file(os.path.join(dirpath, name), output_dir / name)
+        print_info("Copied Claude slash commands to .claude/commands/")
+
+    # 4. Copy CLAUDE.md template if it exists
+    claude_md_output = target / CLAUDE_MD_OUTPUT
+    if CLAUDE_MD_TEMPLATE.is_file() and not claude_md_output.is_file():
+        copy_file(CLAUDE_MD_TEMPLATE, claude_md_output)
+        print_info("Created CLAUDE.md from template.")
+
+    # 5. Copy and set up meta generator script
+    generator_output = target / META_GENERATOR_OUTPUT
+    if META_GENERATOR_SCRIPT.is_file():
+        generator_output.parent.mkdir(exist_ok=True)
+        # chmod +x sets the execute bits the umask allows
+        copy_file(META_GENERATOR_SCRIPT, generator_output, extra_mode=0o111)
+        print_info("Copied axiom meta generator script to scripts/")
+
+    # 6. Initialize .axiom directory structure
+    print_info("Creating .axiom directory structure...")
+    (target / ".axiom" / "meta").mkdir(parents=True, exist_ok=True)
+    (target / ".axiom" / "cache").mkdir(parents=True, exist_ok=True)
+
+    # 7. Run initial metadata scan unless skipped
+    if os.environ.get("AXIOM_SKIP_INITIAL_SCAN"):
+        print_info("AXIOM_SKIP_INITIAL_SCAN is set. Skipping initial scan.")
+        print_info("You can run the scan manually later with: python3 scripts/axiom-meta-generator.py --scan")
+    elif not skip_scan and generator_output.is_file():
+        print_info("Running initial metadata scan...")
+        try:
+            with contextlib.redirect_stdout(scan_output or sys.stdout):
+                print("Scanning project and generating metadata...")
+                load_meta_generator().scan_project(target)
+        except Exception:
+            print_error("Warning: Initial metadata scan failed. You can run it manually later.")
+        else:
+            print_success("Initial metadata scan completed successfully!")
+    else:
+        print_info("Python3 not found or meta generator missing. Skipping initial scan.")
+        print_info("You can run the scan manually later with: python3 scripts/axiom-meta-generator.py --scan")
+
+    # 8. Update .gitignore if it exists
+    gitignore = target / ".gitignore"
+    if gitignore.is_file() and b".axiom-manifest.yml" not in gitignore.read_bytes():
+        with open(gitignore, 'a') as f:
+            f.write(GITIGNORE_ENTRY)
+        print_info("Added Axiom Protocol files to .gitignore.")
+
+    print_success("Axiom Protocol initialized successfully!")
+    print_info("Directory structure created:")
+    print("  .axiom/               # AI-optimized metadata directory")
+    print("  .axiom/meta/          # File-specific metadata")
+    print("  .axiom/cache/         # AI caching and optimization")
+    print("  .axiom/index.yml      # Project-wide AI context")
+    print("  .axiom/index.json     # Same index as JSON, for tools")
+    print("  scripts/              # Axiom management scripts")
+    print("")
+    print_info("Next steps:")
+    print("1. Customize the TODOs in your new '.axiom-manifest.yml' file.")
+    print("2. Review and customize 'CLAUDE.md' for your project needs.")
+    print("3. Start creating '.contract.yml' files for your critical code modules.")
+    print("4. Use /generate-prp-pro to create your first PRP for development.")
+    print("5. Use the structured commit format to explain your changes.")
+    print("")
+    print_info("To update metadata later:")
+    print("  python3 scripts/axiom-meta-generator.py --scan")
+    print("  python3 scripts/axiom-meta-generator.py --update <file>")
+
+    return 0
+
+
+def main():
+    """Main CLI interface for axiom-init."""
+    parser = argparse.ArgumentParser(description='Initialize the Axiom Protocol for a project')
+    parser.add_argument('target_dir', nargs='?', default='.',
+                        help='Project directory to initialize (default: current directory)')
+    parser.add_argument('--skip-scan', action='store_true',
+                        help='Skip the initial metadata scan')
+
+    args = parser.parse_args()
+    sys.exit(run(args.target_dir, skip_scan=args.skip_scan))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,117 @@ Generates and maintains .axiom directory structure with AI-optimized metadata.
 """
 
 import os
+import re
 import sys
+import time
+import mmap
 import yaml
 import json
 import hashlib
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 import argparse
 
+# Prefer the LibYAML bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+# Meta and cache files are JSON (which YAML readers also accept); orjson when available
+try:
+    import orjson
+    
+    def _json_dumps(data: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode()
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+        
+    _json_loads = json.loads
+
+# Fast non-cryptographic hash for change detection; blake2b when xxhash is missing
+try:
+    import xxhash
+    _new_hash = xxhash.xxh3_64
+except ImportError:
+    _new_hash = lambda: hashlib.blake2b(digest_size=8)
+
+# Files up to this size are hashed in one read, larger ones in chunks of this size
+HASH_CHUNK_SIZE = 1 << 20
+
+# Below this many changed files the cost of starting worker processes outweighs
+# the gain; also the batch size handed to each worker
+PARALLEL_MIN_FILES = 64
+
+# Build/cache directories that are never descended into (hidden dirs are skipped too)
+SKIP_DIRS = frozenset({
+    'node_modules', '__pycache__', '.git', 'build', 'dist',
+    'target', '.pytest_cache', '.axiom', 'venv', 'env'
+})
+
+def is_skipped_dir(name: str) -> bool:
+    """Check whether a directory name is excluded from scanning."""
+    return name in SKIP_DIRS or (name.startswith('.') and name != '..')
+
+# Files tracked regardless of their extension
+IMPORTANT_FILES = frozenset({'Dockerfile', 'Makefile', 'README.md', 'LICENSE'})
+
+# Python import statements, matched directly against the file bytes
+_IMPORT_RE = re.compile(rb'^\s*(?:from\s+(\S+)\s+import|import\s+(\S+))', re.MULTILINE)
+
+def content_digest(file_path: Union[str, os.PathLike]) -> str:
+    """Return a hex digest of a file's contents for change detection."""
+    h = _new_hash()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+# Name/suffix tables for file classification (names are lower-cased)
+_CORE_NAMES = frozenset({
+    'main.py', 'index.js', 'app.py', '__init__.py',  # entry points
+    'config.py', 'settings.py', 'package.json'        # configuration
+})
+_CONFIG_NAMES = frozenset({'config.py', 'settings.py', 'package.json', 'requirements.txt'})
+_MODULE_SUFFIXES = frozenset({'.py', '.js', '.ts', '.tsx', '.jsx'})
+
+def _file_type(name_lower: str, suffix: str, parent_name: str) -> str:
+    """Classify a file as test, config, module, doc or script."""
+    if 'test' in name_lower or parent_name == 'tests':
+        return 'test'
+    if name_lower in _CONFIG_NAMES:
+        return 'config'
+    if suffix in _MODULE_SUFFIXES:
+        return 'module'
+    return 'doc' if suffix == '.md' else 'script'
+
+def _importance(name_lower: str) -> str:
+    """Rank a file as core, test or feature."""
+    if name_lower in _CORE_NAMES:
+        return 'core'
+    return 'test' if 'test' in name_lower else 'feature'
+
+def load_meta(meta_path: Path) -> Dict[str, Any]:
+    """Read a meta file, accepting both the JSON layout and older YAML ones."""
+    data = meta_path.read_bytes()
+    try:
+        return _json_loads(data)
+    except ValueError:
+        return yaml.load(data, Loader=_Loader)
+
+# Per-process generator used by scan workers (set by _init_scan_worker)
+_worker_generator = None
+
+
 class AxiomMetaGenerator:
     """Generates and maintains axiom metadata for AI-optimized codebase understanding."""
     
@@ -22,6 +124,17 @@ class AxiomMetaGenerator:
         self.axiom_dir = self.project_root / ".axiom"
         self.meta_dir = self.axiom_dir / "meta" 
         self.cache_dir = self.axiom_dir / "cache"
+        self._root_prefix = os.path.join(str(self.project_root), '')
+        self._meta_prefix = os.path.join(str(self.meta_dir), '')
+        self.scan_state_path = self.cache_dir / "scan_state.json"
+        self.summary_path = self.cache_dir / "summary.json"
+        self.index_json_path = self.axiom_dir / "index.json"
+        # Contract files seen by the current scan; None means check the disk
+        self.contract_files: Optional[frozenset] = None
+        # Meta directories already created by this process
+        self._known_dirs = set()
+        # Report each file handled by update_meta_for_file
+        self.verbose = True
         
         # File type mappings
         self.file_types = {
@@ -72,74 +185,63 @@ class AxiomMetaGenerator:
         if not index_path.exists():
             self.generate_index()
             
-    def should_track_file(self, file_path: Path) -> bool:
-        """Determine if a file should be tracked in axiom metadata."""
-        # Skip hidden files, cache, build artifacts
-        if file_path.name.startswith('.'):
-            return False
-            
-        # Skip common build/cache directories
-        skip_dirs = {
-            'node_modules', '__pycache__', '.git', 'build', 'dist', 
-            'target', '.pytest_cache', '.axiom', 'venv', 'env'
-        }
-        
-        if any(part in skip_dirs for part in file_path.parts):
+    def should_track_name(self, file_name: str) -> bool:
+        """Determine from its name alone if a file in a non-skipped directory is tracked."""
+        # Skip hidden files
+        if file_name.startswith('.'):
             return False
             
         # Only track files with known extensions or important config files
-        important_files = {'Dockerfile', 'Makefile', 'README.md', 'LICENSE'}
-        if file_path.name in important_files:
+        if file_name in IMPORTANT_FILES:
             return True
             
-        return file_path.suffix in self.file_types
+        # Same suffix as os.path.splitext for non-hidden names, at a fraction of the cost
+        _, dot, extension = file_name.rpartition('.')
+        return bool(dot) and ('.' + extension) in self.file_types
+        
+    def should_track_file(self, file_path: Union[str, os.PathLike]) -> bool:
+        """Determine if a file should be tracked in axiom metadata."""
+        path_str = os.fspath(file_path)
+        # Only directories below the project root are subject to skipping
+        if path_str.startswith(self._root_prefix):
+            path_str = path_str[len(self._root_prefix):]
+        *parts, name = path_str.split(os.sep)
+        
+        # Skip common build/cache directories and hidden directories
+        if any(is_skipped_dir(part) for part in parts):
+            return False
+            
+        return self.should_track_name(name)
         
-    def estimate_tokens(self, file_path: Path) -> int:
-        """Estimate token count for a file."""
+    def estimate_tokens(self, file_path: Path, size_bytes: Optional[int] = None) -> int:
+        """Estimate token count for a file, using size_bytes when already known."""
         try:
-            size_bytes = file_path.stat().st_size
-            language = self.file_types.get(file_path.suffix, 'text')
-            multiplier = self.token_multipliers.get(language, 0.3)
-            return int(size_bytes * multiplier)
+            if size_bytes is None:
+                size_bytes = file_path.stat().st_size
+            return self.tokens_for_suffix(file_path.suffix, size_bytes)
         except:
             return 0
             
+    def tokens_for_suffix(self, suffix: str, size_bytes: int) -> int:
+        """Estimate tokens from a file suffix and size alone."""
+        language = self.file_types.get(suffix, 'text')
+        return int(size_bytes * self.token_multipliers.get(language, 0.3))
+            
     def determine_file_type(self, file_path: Path) -> str:
         """Determine the type/category of a file."""
-        name = file_path.name.lower()
-        
-        if 'test' in name or file_path.parent.name == 'tests':
-            return 'test'
-        elif name in ['config.py', 'settings.py', 'package.json', 'requirements.txt']:
-            return 'config'
-        elif file_path.suffix in ['.py', '.js', '.ts', '.tsx', '.jsx']:
-            return 'module'
-        elif file_path.suffix == '.md':
-            return 'doc'
-        else:
-            return 'script'
+        return _file_type(file_path.name.lower(), file_path.suffix, file_path.parent.name)
             
     def determine_importance(self, file_path: Path) -> str:
         """Determine the importance level of a file."""
-        name = file_path.name.lower()
+        return _importance(file_path.name.lower())
         
-        # Core files
-        if name in ['main.py', 'index.js', 'app.py', '__init__.py']:
-            return 'core'
-        
-        # Test files
-        if 'test' in name:
-            return 'test'
-            
-        # Configuration
-        if name in ['config.py', 'settings.py', 'package.json']:
-            return 'core'
-            
-        # Regular feature files
-        return 'feature'
+    def analyze_file_relationships(self, file_path: Path, size_bytes: Optional[int] = None,
+                                   digest: Optional[Any] = None) -> Dict[str, List[str]]:
+        """Analyze imports and dependencies for a file.
         
-    def analyze_file_relationships(self, file_path: Path) -> Dict[str, List[str]]:
-        """Analyze imports and dependencies for a file."""
+        A digest hash object given for a .py file is fed the contents mapped
+        for the analysis, so the caller need not read the file again.
+        """
         relationships = {
             'imports': [],
             'imported_by': [],
@@ -147,36 +249,58 @@ class AxiomMetaGenerator:
             'similar_files': []
         }
         
-        try:
-            content = file_path.read_text(encoding='utf-8')
+        # Simple import detection (can be enhanced)
+        if file_path.suffix != '.py':
+            return relationships
             
-            # Simple import detection (can be enhanced)
-            if file_path.suffix == '.py':
-                import re
-                imports = re.findall(r'from\s+(\S+)\s+import|import\s+(\S+)', content)
-                for imp in imports:
-                    module = imp[0] if imp[0] else imp[1]
-                    if not module.startswith('.'):  # Skip relative imports for now
-                        relationships['imports'].append(module)
+        try:
+            with open(file_path, 'rb') as f:
+                # mmap cannot map empty files
+                if size_bytes is None:
+                    size_bytes = os.fstat(f.fileno()).st_size
+                if size_bytes == 0:
+                    return relationships
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if digest is not None:
+                        digest.update(mm)
+                    for match in _IMPORT_RE.finditer(mm):
+                        module = (match.group(1) or match.group(2)).decode('utf-8', 'replace')
+                        if not module.startswith('.'):  # Skip relative imports for now
+                            relationships['imports'].append(module)
                         
         except Exception:
-            pass
+            # A partly fed digest would be recorded as the file's contents
+            if digest is not None:
+                raise
             
         return relationships
         
-    def generate_file_meta(self, file_path: Path) -> Dict[str, Any]:
-        """Generate metadata for a single file."""
-        relative_path = file_path.relative_to(self.project_root)
+    def generate_file_meta(self, file_path: Path,
+                           stat: Optional[os.stat_result] = None,
+                           now_ns: Optional[int] = None,
+                           digest: Optional[Any] = None) -> Dict[str, Any]:
+        """Generate metadata for a single file, reusing stat and timestamp when already known.
+        
+        digest is passed on to analyze_file_relationships.
+        """
+        relative_path = self.relative_path_of(file_path)
+        if now_ns is None:
+            now_ns = time.time_ns()
         
         # Basic file info
-        stat = file_path.stat()
-        file_type = self.determine_file_type(file_path)
-        language = self.file_types.get(file_path.suffix, 'text')
-        estimated_tokens = self.estimate_tokens(file_path)
-        importance = self.determine_importance(file_path)
+        if stat is None:
+            stat = file_path.stat()
+        name_lower = file_path.name.lower()
+        suffix = file_path.suffix
+        file_type = _file_type(name_lower, suffix, file_path.parent.name)
+        language = self.file_types.get(suffix, 'text')
+        estimated_tokens = self.estimate_tokens(file_path, stat.st_size)
+        importance = _importance(name_lower)
         
         # Analyze relationships
-        relationships = self.analyze_file_relationships(file_path)
+        relationships = self.analyze_file_relationships(file_path, stat.st_size, digest)
+        
+        contract_path = os.path.splitext(relative_path)[0] + '.contract.yml'
         
         # Generate purpose (simple heuristic, can be enhanced with AI)
         purpose = f"Handles {file_path.stem} functionality"
@@ -187,13 +311,14 @@ class AxiomMetaGenerator:
             
         meta = {
             'version': '1.0',
-            'generated_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
+            'generated_at': now_ns,
+            'last_updated': now_ns,
             'file_info': {
-                'path': str(relative_path),
+                'path': relative_path,
                 'type': file_type,
                 'language': language,
                 'size_bytes': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
                 'estimated_tokens': estimated_tokens
             },
             'ai_summary': {
@@ -217,61 +342,291 @@ class AxiomMetaGenerator:
             },
             'relationships': relationships,
             'change_tracking': {
-                'last_significant_change': datetime.now().isoformat(),
+                'last_significant_change': now_ns,
                 'change_frequency': 'medium',
                 'stability': 'stable'
             },
-            'contract_file': str(relative_path.with_suffix('.contract.yml')) if (self.project_root / str(relative_path.with_suffix('.contract.yml'))).exists() else None
+            'contract_file': contract_path if self.has_contract(contract_path) else None
         }
         
         return meta
         
+    def has_contract(self, contract_path: str) -> bool:
+        """Check whether a project-relative contract file exists."""
+        if self.contract_files is not None:
+            return contract_path in self.contract_files
+        return (self.project_root / contract_path).exists()
+        
     def save_file_meta(self, file_path: Path, meta: Dict[str, Any]) -> None:
         """Save metadata for a file."""
-        relative_path = file_path.relative_to(self.project_root)
-        meta_path = self.meta_dir / f"{relative_path}.yml"
+        meta_path = self.meta_path_for(self.relative_path_of(file_path))
         
-        # Create directory structure
-        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create directory structure once per directory
+        parent = meta_path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
         
         # Save metadata
-        with open(meta_path, 'w') as f:
-            yaml.dump(meta, f, default_flow_style=False, sort_keys=False)
+        data = _json_dumps(meta, indent=True)
+        try:
+            meta_path.write_bytes(data)
+        except FileNotFoundError:
+            # Directory removed behind our back (e.g. .axiom/meta deleted)
+            parent.mkdir(parents=True, exist_ok=True)
+            meta_path.write_bytes(data)
             
-    def scan_and_generate_meta(self) -> Dict[str, Any]:
-        """Scan project and generate metadata for all trackable files."""
-        stats = {
-            'total_files': 0,
-            'total_tokens': 0,
-            'files_by_type': {},
-            'files_by_importance': {}
+    def relative_path_of(self, file_path: Union[str, os.PathLike]) -> str:
+        """Return a path relative to the project root, by slicing when it is under the root."""
+        path_str = os.fspath(file_path)
+        if path_str.startswith(self._root_prefix):
+            return path_str[len(self._root_prefix):]
+        return str(Path(path_str).relative_to(self.project_root))
+        
+    def meta_path_for(self, relative_path: str) -> Path:
+        """Return the path of the meta file for a project-relative source path."""
+        return self.meta_dir / f"{relative_path}.yml"
+        
+    def _write_json_atomic(self, path: Path, data: Any) -> None:
+        """Write machine-only cache data as compact JSON via a temp file + rename."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(_json_dumps(data))
+        os.replace(tmp_path, path)
+        
+    def load_scan_state(self) -> Dict[str, List[Any]]:
+        """Load the path -> [mtime_ns, size, meta_mtime_ns, digest, has_contract] map from the last scan."""
+        try:
+            return _json_loads(self.scan_state_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+            
+    def save_scan_state(self, state: Dict[str, List[Any]]) -> None:
+        """Atomically persist the scan state map."""
+        self._write_json_atomic(self.scan_state_path, state)
+        
+    def load_summary(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the path -> {type, importance, tokens} summary of all meta files."""
+        try:
+            return _json_loads(self.summary_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+            
+    def update_summary(self, updated: Optional[Dict[str, Dict[str, Any]]] = None,
+                       removed: Optional[List[str]] = None) -> None:
+        """Patch summary entries after single-file updates or removals."""
+        summary = self.load_summary()
+        if summary is None:
+            # No summary yet: generate_index falls back to reading the meta files
+            return
+        summary.update(updated or {})
+        for relative_path in removed or []:
+            summary.pop(relative_path, None)
+        self._write_json_atomic(self.summary_path, summary)
+        
+    @staticmethod
+    def summary_entry(meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the fields generate_index needs from a file's metadata."""
+        return {
+            'type': meta['file_info']['type'],
+            'importance': meta['ai_summary']['importance'],
+            'tokens': meta['file_info']['estimated_tokens']
         }
         
-        for root, dirs, files in os.walk(self.project_root):
-            root_path = Path(root)
+    def is_unchanged(self, relative_path: str, stat: os.stat_result,
+                     previous: Optional[List[Any]]) -> bool:
+        """Check a source file and its meta file against the last scan state."""
+        if not previous or previous[0] != stat.st_mtime_ns or previous[1] != stat.st_size:
+            return False
+        try:
+            # Regenerate meta files that were removed or edited since the last scan
+            return os.stat(f"{self._meta_prefix}{relative_path}.yml").st_mtime_ns == previous[2]
+        except OSError:
+            return False
             
-            # Skip axiom directory and other excluded directories
-            if '.axiom' in root_path.parts:
+    def is_content_unchanged(self, relative_path: str, file_path: str,
+                             stat: os.stat_result, previous: Optional[List[Any]]) -> bool:
+        """Check whether a file whose mtime moved still has the contents of the last scan."""
+        if not previous or len(previous) < 4 or previous[1] != stat.st_size:
+            return False
+        try:
+            if os.stat(f"{self._meta_prefix}{relative_path}.yml").st_mtime_ns != previous[2]:
+                return False
+            return content_digest(file_path) == previous[3]
+        except OSError:
+            return False
+        
+    def iter_tracked_dirs(self) -> Iterator[List[os.DirEntry]]:
+        """Yield the tracked file entries of each directory, never entering skipped ones."""
+        pending = [str(self.project_root)]
+        while pending:
+            tracked = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not is_skipped_dir(entry.name):
+                                pending.append(entry.path)
+                        elif self.should_track_name(entry.name) and entry.is_file():
+                            tracked.append(entry)
+            except OSError:
                 continue
+            if tracked:
+                yield tracked
                 
-            for file_name in files:
-                file_path = root_path / file_name
+    def iter_tracked_files(self) -> Iterator[os.DirEntry]:
+        """Yield a DirEntry for every tracked file, never entering skipped directories."""
+        for entries in self.iter_tracked_dirs():
+            yield from entries
                 
-                if self.should_track_file(file_path):
-                    print(f"Processing: {file_path.relative_to(self.project_root)}")
-                    
-                    meta = self.generate_file_meta(file_path)
-                    self.save_file_meta(file_path, meta)
+    def process_file(self, file_path: Path, stat: Optional[os.stat_result] = None,
+                     now_ns: Optional[int] = None) -> Tuple[str, str, str, int, List[Any]]:
+        """Generate and save metadata for one file, returning its stats and state entry."""
+        print(f"Processing: {self.relative_path_of(file_path)}")
+        
+        # .py files are read for their imports anyway; hash them during that read
+        digest = _new_hash() if file_path.suffix == '.py' else None
+        meta = self.generate_file_meta(file_path, stat, now_ns, digest)
+        self.save_file_meta(file_path, meta)
+        
+        file_info = meta['file_info']
+        meta_mtime_ns = self.meta_path_for(file_info['path']).stat().st_mtime_ns
+        return (
+            file_info['path'],
+            file_info['type'],
+            meta['ai_summary']['importance'],
+            file_info['estimated_tokens'],
+            [file_info['mtime_ns'], file_info['size_bytes'], meta_mtime_ns,
+             digest.hexdigest() if digest is not None else content_digest(file_path),
+             meta['contract_file'] is not None]
+        )
+        
+    def process_batch(self, paths: List[Path], stats: List[os.stat_result],
+                      contract_files: Optional[frozenset],
+                      now_ns: int) -> List[Tuple[str, str, str, int, List[Any]]]:
+        """Process a batch of files whose contract files are known up front."""
+        self.contract_files = contract_files
+        try:
+            return [self.process_file(path, stat, now_ns) for path, stat in zip(paths, stats)]
+        finally:
+            self.contract_files = None
+            
+    def scan_and_generate_meta(self) -> Dict[str, Any]:
+        """Scan project and generate metadata for all trackable files.
+        
+        Files whose size and mtime match the last scan (and whose meta file and
+        contract presence are unchanged) are counted but not regenerated.
+        """
+        previous_state = self.load_scan_state()
+        state = {}
+        results = []
+        
+        # Changed files are handed off in batches of whole directories while the
+        # walk continues; a directory's contract files sit next to its sources
+        walk_sees_contracts = '.yml' in self.file_types
+        paths = []
+        stats_by_path = []
+        contracts = set()
+        processed = []
+        in_flight = set()
+        executor = None
+        workers = os.cpu_count() or 1
+        now_ns = time.time_ns()
+        root_prefix_len = len(self._root_prefix)
+        
+        def flush(final: bool) -> None:
+            nonlocal executor, paths, stats_by_path, contracts
+            # Contracts are .yml files, so only trust the walk when .yml is tracked
+            batch_contracts = frozenset(contracts) if walk_sees_contracts else None
+            if executor is None and not final and workers > 1:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_scan_worker,
+                    initargs=(str(self.project_root), self.file_types, self.token_multipliers)
+                )
+            if executor is not None:
+                in_flight.add(executor.submit(
+                    _scan_batch, paths, stats_by_path, batch_contracts, now_ns))
+                # Bound the backlog so the walk cannot run arbitrarily far ahead
+                while len(in_flight) > 2 * workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.discard(future)
+                        processed.extend(future.result())
+            else:
+                processed.extend(self.process_batch(paths, stats_by_path, batch_contracts, now_ns))
+            paths, stats_by_path, contracts = [], [], set()
+            
+        try:
+            for entries in self.iter_tracked_dirs():
+                parent_name = os.path.basename(os.path.dirname(entries[0].path))
+                dir_contracts = {entry.path[root_prefix_len:] for entry in entries
+                                 if entry.name.endswith('.contract.yml')}
+                contracts.update(dir_contracts)
+                for entry in entries:
+                    # One stat per file, shared by change detection and meta generation
+                    stat = entry.stat()
+                    relative_path = entry.path[root_prefix_len:]
+                    previous = previous_state.get(relative_path)
                     
-                    # Update stats
-                    stats['total_files'] += 1
-                    stats['total_tokens'] += meta['file_info']['estimated_tokens']
+                    # Adding or removing a contract changes the meta's contract_file
+                    contract_path = os.path.splitext(relative_path)[0] + '.contract.yml'
+                    if walk_sees_contracts:
+                        has_contract = contract_path in dir_contracts
+                    else:
+                        has_contract = os.path.exists(self._root_prefix + contract_path)
+                    if previous and (len(previous) < 5 or previous[4] != has_contract):
+                        previous = None
                     
-                    file_type = meta['file_info']['type']
-                    importance = meta['ai_summary']['importance']
+                    # Plain str paths here; a Path is only built for files to regenerate
+                    unchanged = self.is_unchanged(relative_path, stat, previous)
+                    if not unchanged and self.is_content_unchanged(relative_path, entry.path, stat, previous):
+                        # Touched but not edited: keep the meta, remember the new mtime
+                        previous = [stat.st_mtime_ns] + previous[1:]
+                        unchanged = True
+                        
+                    if unchanged:
+                        state[relative_path] = previous
+                        name_lower = entry.name.lower()
+                        suffix = os.path.splitext(entry.name)[1]
+                        results.append((
+                            relative_path,
+                            _file_type(name_lower, suffix, parent_name),
+                            _importance(name_lower),
+                            self.tokens_for_suffix(suffix, stat.st_size)
+                        ))
+                    else:
+                        paths.append(Path(entry.path))
+                        stats_by_path.append(stat)
+                        
+                if len(paths) >= PARALLEL_MIN_FILES:
+                    flush(final=False)
                     
-                    stats['files_by_type'][file_type] = stats['files_by_type'].get(file_type, 0) + 1
-                    stats['files_by_importance'][importance] = stats['files_by_importance'].get(importance, 0) + 1
+            if paths:
+                flush(final=True)
+            for future in in_flight:
+                processed.extend(future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown()
+                
+        for relative_path, file_type, importance, tokens, entry in processed:
+            state[relative_path] = entry
+            results.append((relative_path, file_type, importance, tokens))
+            
+        stats = {
+            'total_files': len(results),
+            'total_tokens': sum(tokens for _, _, _, tokens in results),
+            'files_by_type': dict(Counter(file_type for _, file_type, _, _ in results)),
+            'files_by_importance': dict(Counter(importance for _, _, importance, _ in results))
+        }
+            
+        self.save_scan_state(state)
+        # Lets generate_index skip re-parsing every meta file just written
+        self._write_json_atomic(self.summary_path, {
+            relative_path: {'type': file_type, 'importance': importance, 'tokens': tokens}
+            for relative_path, file_type, importance, tokens in results
+        })
                     
         return stats
         
@@ -286,39 +641,46 @@ class AxiomMetaGenerator:
             'test_files': {'files': [], 'estimated_tokens': 0}
         }
         
-        if self.meta_dir.exists():
-            for meta_file in self.meta_dir.rglob("*.yml"):
-                try:
-                    with open(meta_file, 'r') as f:
-                        meta = yaml.safe_load(f)
+        summary = self.load_summary()
+        if summary is None:
+            # First run or removed cache: rebuild from the meta files themselves
+            summary = {}
+            if self.meta_dir.exists():
+                for meta_file in self.meta_dir.rglob("*.yml"):
+                    try:
+                        meta = load_meta(meta_file)
+                        summary[meta['file_info']['path']] = self.summary_entry(meta)
+                    except Exception as e:
+                        print(f"Error reading {meta_file}: {e}")
                         
-                    file_path = meta['file_info']['path']
-                    importance = meta['ai_summary']['importance']
-                    file_type = meta['file_info']['type']
-                    tokens = meta['file_info']['estimated_tokens']
-                    
-                    meta_files.append(file_path)
-                    
-                    # Categorize files
-                    if importance == 'core':
-                        file_categories['core_modules']['files'].append(file_path)
-                        file_categories['core_modules']['estimated_tokens'] += tokens
-                    elif file_type == 'test':
-                        file_categories['test_files']['files'].append(file_path)
-                        file_categories['test_files']['estimated_tokens'] += tokens
-                    elif file_type == 'config':
-                        file_categories['config_files']['files'].append(file_path)
-                        file_categories['config_files']['estimated_tokens'] += tokens
-                    else:
-                        file_categories['feature_modules']['files'].append(file_path)
-                        file_categories['feature_modules']['estimated_tokens'] += tokens
-                        
-                except Exception as e:
-                    print(f"Error reading {meta_file}: {e}")
+        for file_path, entry in sorted(summary.items()):
+            importance = entry['importance']
+            file_type = entry['type']
+            tokens = entry['tokens']
+            
+            meta_files.append(file_path)
+            
+            # Categorize files
+            if importance == 'core':
+                file_categories['core_modules']['files'].append(file_path)
+                file_categories['core_modules']['estimated_tokens'] += tokens
+            elif file_type == 'test':
+                file_categories['test_files']['files'].append(file_path)
+                file_categories['test_files']['estimated_tokens'] += tokens
+            elif file_type == 'config':
+                file_categories['config_files']['files'].append(file_path)
+                file_categories['config_files']['estimated_tokens'] += tokens
+            else:
+                file_categories['feature_modules']['files'].append(file_path)
+                file_categories['feature_modules']['estimated_tokens'] += tokens
                     
+        # Meta files carry epoch nanoseconds; the index is read by people too
+        now_ns = time.time_ns()
+        now_iso = datetime.fromtimestamp(now_ns / 1e9).isoformat()
         index = {
             'version': '1.0',
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_ns,
+            'generated_at_iso': now_iso,
             'project_root': '.',
             'project_context': {
                 'name': self.project_root.name,
@@ -336,45 +698,123 @@ class AxiomMetaGenerator:
             },
             'meta_files': {
                 'total_count': len(meta_files),
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': now_iso,
                 'sync_status': 'clean'
             }
         }
         
         # Save index
         index_path = self.axiom_dir / "index.yml"
-        with open(index_path, 'w') as f:
-            yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+        index_path.write_bytes(
+            yaml.dump(index, Dumper=_Dumper, default_flow_style=False, sort_keys=False).encode()
+        )
+        self.write_index_json(index)
+        
+    def write_index_json(self, index: Dict[str, Any]) -> None:
+        """Write the index as .axiom/index.json, the supported JSON copy of index.yml for tools."""
+        self._write_json_atomic(self.index_json_path, index)
             
     def update_meta_for_file(self, file_path: str) -> None:
         """Update metadata for a specific file."""
-        file_path = Path(file_path)
-        if self.should_track_file(file_path) and file_path.exists():
-            meta = self.generate_file_meta(file_path)
-            self.save_file_meta(file_path, meta)
-            print(f"Updated meta for: {file_path}")
-        else:
-            print(f"Skipping: {file_path}")
+        self.update_meta_for_files([file_path])
+        
+    def update_meta_for_files(self, file_paths: List[str],
+                              stats: Optional[List[Optional[os.stat_result]]] = None) -> List[bool]:
+        """Update metadata for several files at once, returning which were updated.
+        
+        Relative paths are taken relative to the project root. The timestamp and
+        the summary write are shared by the whole batch; a known stat per path
+        (None where unknown) saves stat-ing the files again.
+        """
+        now_ns = time.time_ns()
+        updated = {}
+        results = []
+        for file_path, stat in zip(map(Path, file_paths), stats or repeat(None)):
+            if not file_path.is_absolute():
+                file_path = self.project_root / file_path
+            if stat is None:
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    stat = None
+            if stat is None or not self.should_track_file(file_path):
+                if self.verbose:
+                    print(f"Skipping: {file_path}")
+                results.append(False)
+                continue
+            try:
+                meta = self.generate_file_meta(file_path, stat, now_ns)
+                self.save_file_meta(file_path, meta)
+            except (OSError, ValueError) as e:
+                print(f"Error updating meta for {file_path}: {e}")
+                results.append(False)
+                continue
+            updated[meta['file_info']['path']] = self.summary_entry(meta)
+            results.append(True)
+            if self.verbose:
+                print(f"Updated meta for: {file_path}")
+                
+        if updated:
+            self.update_summary(updated)
+        return results
             
     def clean_orphaned_meta(self) -> None:
-        """Remove metadata files for which source files no longer exist."""
+        """Remove metadata for files that are no longer tracked, and emptied meta directories."""
         if not self.meta_dir.exists():
             return
             
-        for meta_file in self.meta_dir.rglob("*.yml"):
-            # Extract original file path
-            relative_meta = meta_file.relative_to(self.meta_dir)
-            original_path = self.project_root / str(relative_meta)[:-4]  # Remove .yml
-            
-            if not original_path.exists():
-                print(f"Removing orphaned meta: {meta_file}")
-                meta_file.unlink()
+        root_prefix_len = len(self._root_prefix)
+        live = {entry.path[root_prefix_len:] for entry in self.iter_tracked_files()}
+        meta_root = str(self.meta_dir)
+        meta_prefix_len = len(os.path.join(meta_root, ''))
+        
+        removed = []
+        for dir_path, dir_names, file_names in os.walk(meta_root, topdown=False):
+            remaining = len(file_names)
+            for file_name in file_names:
+                if not file_name.endswith('.yml'):
+                    continue
+                meta_file = os.path.join(dir_path, file_name)
+                relative_path = meta_file[meta_prefix_len:-4]  # Remove .yml
+                if relative_path not in live:
+                    print(f"Removing orphaned meta: {meta_file}")
+                    os.unlink(meta_file)
+                    removed.append(relative_path)
+                    remaining -= 1
+                    
+            # Children were visited first, so only still-present subdirectories count
+            if dir_path != meta_root and not remaining and not any(
+                    os.path.isdir(os.path.join(dir_path, name)) for name in dir_names):
+                os.rmdir(dir_path)
+                self._known_dirs.discard(Path(dir_path))
                 
-                # Remove empty directories
-                try:
-                    meta_file.parent.rmdir()
-                except:
-                    pass
+        if removed:
+            self.update_summary(removed=removed)
+
+def _init_scan_worker(project_root: str, file_types: Dict[str, str],
+                      token_multipliers: Dict[str, float]) -> None:
+    """Create the generator used by a scan worker process."""
+    global _worker_generator
+    _worker_generator = AxiomMetaGenerator(project_root)
+    _worker_generator.file_types = file_types
+    _worker_generator.token_multipliers = token_multipliers
+    
+def _scan_batch(paths: List[Path], stats: List[os.stat_result], contract_files: Optional[frozenset],
+                now_ns: int) -> List[Tuple[str, str, str, int, List[Any]]]:
+    """Process a batch of files inside a scan worker process."""
+    return _worker_generator.process_batch(paths, stats, contract_files, now_ns)
+
+def scan_project(project_root: Union[str, os.PathLike] = ".") -> Dict[str, Any]:
+    """Initialize the axiom structure, then regenerate all metadata and the index.
+    
+    This is what --scan does, for callers running in-process; returns the scan stats.
+    """
+    generator = AxiomMetaGenerator(project_root)
+    generator.init_axiom_structure()
+    stats = generator.scan_and_generate_meta()
+    generator.generate_index()
+    return stats
+
 
 def main():
     parser = argparse.ArgumentParser(description='Axiom Meta Generator')
@@ -395,9 +835,7 @@ def main():
         
     if args.scan:
         print("Scanning project and generating metadata...")
-        generator.init_axiom_structure()
-        stats = generator.scan_and_generate_meta()
-        generator.generate_index()
+        stats = scan_project(args.project_root)
         
         print(f"\nGeneration complete:")
         print(f"  Total files: {stats['total_files']}")
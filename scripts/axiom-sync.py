@@ -7,15 +7,92 @@ Monitors file changes and automatically updates meta information.
 import os
 import sys
 import time
+import mmap
+import queue
+import logging
 import hashlib
+from stat import S_ISREG
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Set, Optional
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Set, Optional, Tuple, Union
 import yaml
 
+# Prefer the LibYAML bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 # Import the meta generator
-from axiom_meta_generator import AxiomMetaGenerator
+from axiom_meta_generator import AxiomMetaGenerator, is_skipped_dir
+
+# Per-file progress is logged at DEBUG; the CLI shows it with --verbose
+logger = logging.getLogger("axiom.sync")
+
+# Sync cache (de)serialization; orjson when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = lambda data: json.dumps(data, separators=(',', ':')).encode()
+
+# Directory listings this recent are not reused, as in git's racy-index check
+LISTING_RACY_WINDOW_NS = 2 * 10**9
+
+# Change detection needs a fast fingerprint, not collision resistance
+def _new_hash():
+    return hashlib.blake2b(digest_size=16)
+
+EMPTY_DIGEST = _new_hash().hexdigest()
+
+# Files this large are hashed straight from an mmap of the page cache
+HASH_MMAP_MIN_SIZE = 1 << 20
+
+# Reading for a hash shouldn't cost an atime write-back per file (Linux only)
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Bumped whenever cached hashes stop being comparable, e.g. a new hash function
+CACHE_VERSION = 2
+
+# Below this many files to hash, starting a thread pool costs more than it saves
+HASH_THREADS_MIN_FILES = 8
+
+# Seconds of quiet after a filesystem event before the collected changes are synced
+WATCH_DEBOUNCE_SECONDS = 0.5
+
+# Event-driven watch mode is optional; polling is used when watchdog is missing
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def _cache_entry(file_hash: str, stat: os.stat_result) -> Dict[str, Any]:
+    """Build a sync cache entry: hash, size, mtime_ns and inode."""
+    return {'h': file_hash, 's': stat.st_size, 'm': stat.st_mtime_ns, 'i': stat.st_ino}
+
+
+class _ChangeCollector(FileSystemEventHandler):
+    """Forward paths of created, modified, deleted and moved files to a queue."""
+    
+    def __init__(self, events: "queue.Queue[str]"):
+        super().__init__()
+        self.events = events
+        
+    def on_any_event(self, event) -> None:
+        if event.is_directory or event.event_type not in ('created', 'modified', 'deleted', 'moved'):
+            return
+        self.events.put(event.src_path)
+        if event.event_type == 'moved':
+            self.events.put(event.dest_path)
 
 
 class AxiomSync:
@@ -24,134 +101,370 @@ class AxiomSync:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.generator = AxiomMetaGenerator(str(self.project_root))
-        self.cache_file = self.project_root / ".axiom" / "cache" / "sync_cache.yml"
-        self.file_hashes: Dict[str, str] = {}
+        # Relative paths are sliced off absolute ones instead of using relative_to
+        self._root_prefix = os.path.join(str(self.project_root), '')
+        self._root_prefix_len = len(self._root_prefix)
+        # Per-file generator output follows our log level (--verbose)
+        self.generator.verbose = logger.isEnabledFor(logging.DEBUG)
+        # Machine-only cache, so JSON rather than YAML
+        self.cache_file = self.project_root / ".axiom" / "cache" / "sync_cache.json"
+        self.legacy_cache_file = self.cache_file.with_suffix('.yml')
+        # One-line status file, so status changes don't rewrite index.yml
+        self.status_file = self.project_root / ".axiom" / "sync.status"
+        self.index_path = self.project_root / ".axiom" / "index.yml"
+        # relative path -> {'h': blake2b-128, 's': size, 'm': mtime_ns, 'i': inode}
+        self.file_hashes: Dict[str, Dict[str, Any]] = {}
+        # relative dir path ('' is the root) -> digest over its children; see tree_hash
+        self.dir_hashes: Dict[str, str] = {}
         self.last_sync_time = datetime.now()
+        # Set whenever the in-memory cache diverges from sync_cache.json
+        self._cache_dirty = False
+        # relative path -> stat of changed files, handed to the generator on sync
+        self._pending_stats: Dict[str, os.stat_result] = {}
+        # dir path -> (mtime_ns, tracked file paths, subdir paths) from the last scan
+        self._dir_listings: Dict[str, Tuple[int, List[str], List[str]]] = {}
         
         # Load cached hashes
         self.load_cache()
         
     def load_cache(self) -> None:
         """Load cached file hashes from previous runs."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cache_data = yaml.safe_load(f) or {}
+        try:
+            if self.cache_file.exists():
+                cache_data = _json_loads(self.cache_file.read_bytes())
+            elif self.legacy_cache_file.exists():
+                # Caches written before the switch to JSON
+                with open(self.legacy_cache_file, 'r') as f:
+                    cache_data = yaml.load(f, Loader=_Loader) or {}
+            else:
+                return
+            # Hashes from another cache version can't be compared, so every
+            # file is rehashed and resynced once
+            if cache_data.get('version') == CACHE_VERSION:
                 self.file_hashes = cache_data.get('file_hashes', {})
-                last_sync = cache_data.get('last_sync_time')
-                if last_sync:
-                    self.last_sync_time = datetime.fromisoformat(last_sync)
-            except Exception as e:
-                print(f"Warning: Could not load sync cache: {e}")
-                self.file_hashes = {}
+                self.dir_hashes = cache_data.get('dir_hashes', {})
+                # Migrate YAML caches to JSON on the next save
+                self._cache_dirty = not self.cache_file.exists()
+            else:
+                self._cache_dirty = True
+            last_sync = cache_data.get('last_sync_time')
+            if last_sync:
+                self.last_sync_time = datetime.fromisoformat(last_sync)
+        except Exception as e:
+            print(f"Warning: Could not load sync cache: {e}")
+            self.file_hashes = {}
+            self.dir_hashes = {}
     
     def save_cache(self) -> None:
-        """Save current file hashes to cache."""
+        """Save current file hashes to cache, if anything changed since the last save."""
+        if not self._cache_dirty:
+            return
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
             
             cache_data = {
+                'version': CACHE_VERSION,
                 'file_hashes': self.file_hashes,
+                'dir_hashes': self.dir_hashes,
+                'tree_hash': self.tree_hash(),
                 'last_sync_time': self.last_sync_time.isoformat(),
                 'generated_at': datetime.now().isoformat()
             }
             
-            with open(self.cache_file, 'w') as f:
-                yaml.dump(cache_data, f, default_flow_style=False)
+            self.cache_file.write_bytes(_json_dumps(cache_data))
+            self._cache_dirty = False
+            if self.legacy_cache_file.exists():
+                self.legacy_cache_file.unlink()
                 
         except Exception as e:
             print(f"Warning: Could not save sync cache: {e}")
     
-    def calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file."""
+    def mark_synced(self) -> None:
+        """Record that a sync just completed."""
+        self.last_sync_time = datetime.now()
+        self._cache_dirty = True
+    
+    def set_file_hash(self, relative_path: str, entry: Dict[str, Any]) -> None:
+        """Store a file's cache entry, invalidating ancestor digests if its hash changed."""
+        previous = self.file_hashes.get(relative_path)
+        if previous == entry:
+            return
+        self.file_hashes[relative_path] = entry
+        self._cache_dirty = True
+        if not previous or previous['h'] != entry['h']:
+            self._invalidate_dirs(relative_path)
+    
+    def drop_file_hash(self, relative_path: str) -> bool:
+        """Forget a deleted file, returning whether it was known."""
+        if self.file_hashes.pop(relative_path, None) is None:
+            return False
+        self._cache_dirty = True
+        self._invalidate_dirs(relative_path)
+        return True
+    
+    def _invalidate_dirs(self, relative_path: str) -> None:
+        """Drop the cached digest of every directory above relative_path."""
+        directory = relative_path
+        while directory:
+            directory = directory.rpartition(os.sep)[0]
+            self.dir_hashes.pop(directory, None)
+    
+    def tree_hash(self) -> str:
+        """Return a Merkle digest of all tracked files, rehashing only invalidated dirs."""
+        files_by_dir = defaultdict(list)
+        for relative_path, entry in self.file_hashes.items():
+            parent, _, name = relative_path.rpartition(os.sep)
+            files_by_dir[parent].append((name, entry['h']))
+        
+        subdirs = defaultdict(list)
+        known_dirs = {''}
+        for directory in list(files_by_dir):
+            while directory not in known_dirs:
+                known_dirs.add(directory)
+                parent = directory.rpartition(os.sep)[0]
+                subdirs[parent].append(directory)
+                directory = parent
+        # Digests of directories that no longer hold tracked files
+        for directory in self.dir_hashes.keys() - known_dirs:
+            del self.dir_hashes[directory]
+        
+        def digest(directory: str) -> str:
+            if directory not in self.dir_hashes:
+                children = files_by_dir[directory] + [
+                    (subdir.rpartition(os.sep)[2], digest(subdir)) for subdir in subdirs[directory]
+                ]
+                h = _new_hash()
+                for name, child_hash in sorted(children):
+                    h.update(f"{name}\0{child_hash}\n".encode())
+                self.dir_hashes[directory] = h.hexdigest()
+            return self.dir_hashes[directory]
+        
+        return digest('')
+    
+    def calculate_file_hash(self, file_path: Union[str, os.PathLike],
+                            stat: Optional[os.stat_result] = None) -> str:
+        """Calculate the content hash of a file, skipping the open when stat shows it empty."""
+        if stat is not None and stat.st_size == 0:
+            return EMPTY_DIGEST
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            return hashlib.sha256(content).hexdigest()
+            try:
+                fd = os.open(file_path, os.O_RDONLY | _O_NOATIME)
+            except PermissionError:
+                # O_NOATIME is refused on files owned by another user
+                if not _O_NOATIME:
+                    raise
+                fd = os.open(file_path, os.O_RDONLY)
+            try:
+                size = stat.st_size if stat is not None else os.fstat(fd).st_size
+                if size >= HASH_MMAP_MIN_SIZE:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                        h = _new_hash()
+                        h.update(mapped)
+                        return h.hexdigest()
+                with os.fdopen(fd, 'rb', closefd=False) as f:
+                    # Stream in fixed-size chunks rather than reading the whole file
+                    if hasattr(hashlib, 'file_digest'):
+                        return hashlib.file_digest(f, _new_hash).hexdigest()
+                    h = _new_hash()
+                    while chunk := f.read(1 << 18):
+                        h.update(chunk)
+                    return h.hexdigest()
+            finally:
+                os.close(fd)
         except Exception:
             return ""
     
-    def scan_for_changes(self) -> Set[str]:
-        """Scan for changed files since last sync."""
+    def _iter_tracked_files(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """Yield (relative_path, path, stat) for every tracked file.
+        
+        A directory's mtime does not move when a file inside it is edited, so
+        every file is still stat-ed; only the listing of a directory whose mtime
+        is unchanged since the previous scan by this instance is reused.
+        """
+        root_prefix_len = self._root_prefix_len
+        racy_before_ns = time.time_ns() - LISTING_RACY_WINDOW_NS
+        listings = {}
+        pending = [str(self.project_root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                dir_mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            cached = self._dir_listings.get(directory)
+            if cached and cached[0] == dir_mtime:
+                _, files, subdirs = cached
+            else:
+                files, subdirs = [], []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not is_skipped_dir(entry.name):
+                                    subdirs.append(entry.path)
+                            elif self.generator.should_track_name(entry.name) and entry.is_file():
+                                files.append(entry.path)
+                except OSError:
+                    continue
+            # A listing taken in the same timestamp tick as a change could miss it
+            if dir_mtime < racy_before_ns:
+                listings[directory] = (dir_mtime, files, subdirs)
+            pending.extend(subdirs)
+            
+            for path in files:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if S_ISREG(stat.st_mode):
+                    yield path[root_prefix_len:], path, stat
+        self._dir_listings = listings
+    
+    def scan_for_changes(self) -> Tuple[Set[str], Set[str]]:
+        """Scan for files changed and deleted since last sync."""
         changed_files = set()
+        existing_files = set()
         
-        # Scan all trackable files
-        for root, dirs, files in os.walk(self.project_root):
-            root_path = Path(root)
+        # One walk both detects candidates and records which files still exist
+        candidates = []
+        for relative_path, path, stat in self._iter_tracked_files():
+            existing_files.add(relative_path)
+            cached = self.file_hashes.get(relative_path)
             
-            # Skip .axiom directory and other excluded directories
-            if '.axiom' in root_path.parts:
-                continue
-                
-            for file_name in files:
-                file_path = root_path / file_name
-                
-                if self.generator.should_track_file(file_path):
-                    relative_path = str(file_path.relative_to(self.project_root))
-                    current_hash = self.calculate_file_hash(file_path)
-                    
-                    # Check if file is new or changed
-                    if relative_path not in self.file_hashes or self.file_hashes[relative_path] != current_hash:
-                        changed_files.add(relative_path)
-                        self.file_hashes[relative_path] = current_hash
+            # Only hash files whose size or mtime moved since the last sync
+            if not (cached and cached['s'] == stat.st_size and cached['m'] == stat.st_mtime_ns):
+                candidates.append((relative_path, path, stat))
         
-        # Check for deleted files
-        existing_files = set()
-        for root, dirs, files in os.walk(self.project_root):
-            root_path = Path(root)
-            if '.axiom' in root_path.parts:
-                continue
-            for file_name in files:
-                file_path = root_path / file_name
-                if self.generator.should_track_file(file_path):
-                    existing_files.add(str(file_path.relative_to(self.project_root)))
+        deleted_files = self.file_hashes.keys() - existing_files
+        # A rename keeps the inode, size and mtime, so the old hash still applies
+        renamed_from = {
+            (entry.get('i'), entry['s'], entry['m']): entry['h']
+            for entry in map(self.file_hashes.get, deleted_files)
+        }
+        to_hash = []
+        hashes = {}
+        for relative_path, path, stat in candidates:
+            known_hash = None
+            if relative_path not in self.file_hashes:
+                known_hash = renamed_from.get((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            if known_hash is None:
+                to_hash.append((relative_path, path, stat))
+            else:
+                hashes[relative_path] = known_hash
         
-        deleted_files = set(self.file_hashes.keys()) - existing_files
+        # hashlib releases the GIL while hashing, so threads overlap I/O and CPU
+        if len(to_hash) >= HASH_THREADS_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                hashes.update(zip(
+                    (relative_path for relative_path, _, _ in to_hash),
+                    executor.map(self.calculate_file_hash,
+                                 (path for _, path, _ in to_hash), (stat for _, _, stat in to_hash))
+                ))
+        else:
+            hashes.update((relative_path, self.calculate_file_hash(path, stat))
+                          for relative_path, path, stat in to_hash)
+        
+        for relative_path, _, stat in candidates:
+            current_hash = hashes[relative_path]
+            cached = self.file_hashes.get(relative_path)
+            
+            # Check if file is new or changed
+            if not cached or cached['h'] != current_hash:
+                changed_files.add(relative_path)
+                self._pending_stats[relative_path] = stat
+            self.set_file_hash(relative_path, _cache_entry(current_hash, stat))
+        
+        # Check for deleted files
         for deleted_file in deleted_files:
-            del self.file_hashes[deleted_file]
-            print(f"File deleted: {deleted_file}")
+            self.drop_file_hash(deleted_file)
+            logger.debug("File deleted: %s", deleted_file)
         
-        return changed_files
+        return changed_files, deleted_files
     
     def sync_meta_for_file(self, relative_path: str) -> bool:
         """Sync meta information for a specific file."""
-        file_path = self.project_root / relative_path
-        
-        if not file_path.exists():
-            print(f"File not found: {relative_path}")
-            return False
+        return self.sync_meta_for_files([relative_path]) == 1
+    
+    def sync_meta_for_files(self, relative_paths: Iterable[str]) -> int:
+        """Sync meta for several files through one generator call, returning the success count."""
+        relative_paths = sorted(relative_paths)
+        for relative_path in relative_paths:
+            logger.debug("Syncing meta for: %s", relative_path)
         
+        # Reuse the stat taken while scanning rather than stat-ing each file again
+        pending_stats = self._pending_stats
+        self._pending_stats = {}
         try:
-            print(f"Syncing meta for: {relative_path}")
-            self.generator.update_meta_for_file(str(file_path))
-            return True
+            results = self.generator.update_meta_for_files(
+                relative_paths, [pending_stats.get(path) for path in relative_paths])
         except Exception as e:
-            print(f"Error syncing {relative_path}: {e}")
-            return False
+            logger.warning("Error syncing %d files: %s", len(relative_paths), e)
+            return 0
+        
+        for relative_path, synced in zip(relative_paths, results):
+            if not synced:
+                logger.debug("Not synced: %s", relative_path)
+        return sum(results)
+    
+    def remove_meta_for_files(self, relative_paths: Iterable[str]) -> None:
+        """Delete the meta files of deleted sources and drop them from the summary."""
+        removed = []
+        for relative_path in relative_paths:
+            try:
+                self.generator.meta_path_for(relative_path).unlink()
+            except FileNotFoundError:
+                pass
+            removed.append(relative_path)
+        if removed:
+            self.generator.update_summary(removed=removed)
     
     def update_sync_status(self, status: str = "clean") -> None:
-        """Update sync status in index.yml."""
-        index_path = self.project_root / ".axiom" / "index.yml"
+        """Record sync status in .axiom/sync.status, touching index.yml only when it is stale."""
+        index_path = self.index_path
         
         if not index_path.exists():
             return
         
         try:
-            with open(index_path, 'r') as f:
-                index = yaml.safe_load(f) or {}
+            self.status_file.write_text(f"{status}\n{datetime.now().isoformat()}\n")
             
-            if 'meta_files' not in index:
-                index['meta_files'] = {}
-            
-            index['meta_files']['sync_status'] = status
-            index['meta_files']['last_updated'] = datetime.now().isoformat()
-            
-            with open(index_path, 'w') as f:
-                yaml.dump(index, f, default_flow_style=False, sort_keys=False)
+            # generate_index already writes a clean index.yml, so the full YAML
+            # round trip is only needed when a final status differs from it
+            if status != "syncing":
+                raw_index = index_path.read_bytes()
+                if f"sync_status: {status}\n".encode() not in raw_index:
+                    self.mark_index_status(index_path, status, raw_index)
                 
         except Exception as e:
             print(f"Error updating sync status: {e}")
     
+    def read_status_file(self) -> Optional[str]:
+        """Return the status recorded in .axiom/sync.status, if any."""
+        try:
+            return self.status_file.read_text().split('\n', 1)[0] or None
+        except OSError:
+            return None
+    
+    def mark_index_status(self, index_path: Path, status: str, raw_index: Optional[bytes] = None) -> None:
+        """Rewrite sync_status in index.yml (and its index.json mirror) for readers that only look there.
+        
+        raw_index is the file's content when the caller has already read it.
+        """
+        if raw_index is None:
+            raw_index = index_path.read_bytes()
+        index = yaml.load(raw_index, Loader=_Loader) or {}
+        
+        if 'meta_files' not in index:
+            index['meta_files'] = {}
+        
+        index['meta_files']['sync_status'] = status
+        index['meta_files']['last_updated'] = datetime.now().isoformat()
+        
+        with open(index_path, 'w') as f:
+            yaml.dump(index, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        if self.generator.index_json_path.exists():
+            self.generator.write_index_json(index)
+    
     def full_sync(self) -> None:
         """Perform a full synchronization of all files."""
         print("Performing full sync...")
@@ -163,30 +476,32 @@ class AxiomSync:
         self.update_sync_status("syncing")
         
         try:
+            # Without a cache, meta left by files deleted earlier can't be told apart
+            had_cache = bool(self.file_hashes)
+            
             # Scan for all changes
-            changed_files = self.scan_for_changes()
+            changed_files, deleted_files = self.scan_for_changes()
             
             if not changed_files:
                 print("No changes detected.")
             else:
                 print(f"Found {len(changed_files)} changed files")
                 
-                # Update meta for each changed file
-                success_count = 0
-                for file_path in changed_files:
-                    if self.sync_meta_for_file(file_path):
-                        success_count += 1
+                # Update meta for all changed files in one batch
+                success_count = self.sync_meta_for_files(changed_files)
                 
                 print(f"Successfully synced {success_count}/{len(changed_files)} files")
             
             # Clean orphaned meta files
-            self.generator.clean_orphaned_meta()
+            if deleted_files or not had_cache:
+                self.generator.clean_orphaned_meta()
             
             # Regenerate index
-            self.generator.generate_index()
+            if changed_files or deleted_files or not had_cache or not self.index_path.exists():
+                self.generator.generate_index()
             
             # Update timestamps
-            self.last_sync_time = datetime.now()
+            self.mark_synced()
             
             # Mark as clean
             self.update_sync_status("clean")
@@ -209,25 +524,32 @@ class AxiomSync:
         self.update_sync_status("syncing")
         
         try:
-            changed_files = self.scan_for_changes()
+            changed_files, deleted_files = self.scan_for_changes()
+            
+            # The cache forgets deleted files, so a later full sync would not
+            # see them either: remove their meta now
+            if deleted_files:
+                self.remove_meta_for_files(deleted_files)
             
             if not changed_files:
                 print("No changes detected.")
+                if deleted_files:
+                    self.generator.generate_index()
+                    self.mark_synced()
                 self.update_sync_status("clean")
+                # Deletions and touched-but-unedited files still update the cache
+                self.save_cache()
                 return
             
             print(f"Syncing {len(changed_files)} changed files...")
             
-            success_count = 0
-            for file_path in changed_files:
-                if self.sync_meta_for_file(file_path):
-                    success_count += 1
+            success_count = self.sync_meta_for_files(changed_files)
             
             # Update index only if we had changes
-            if success_count > 0:
+            if success_count > 0 or deleted_files:
                 self.generator.generate_index()
             
-            self.last_sync_time = datetime.now()
+            self.mark_synced()
             self.update_sync_status("clean")
             self.save_cache()
             
@@ -239,7 +561,75 @@ class AxiomSync:
             raise
     
     def watch_mode(self, interval: int = 30) -> None:
-        """Watch for file changes and auto-sync."""
+        """Watch for file changes and auto-sync on filesystem events."""
+        if Observer is None:
+            print("watchdog is not installed; falling back to polling")
+            self.watch_poll_mode(interval)
+            return
+        
+        # Catch up on anything that changed while we were not watching
+        self.incremental_sync()
+        
+        events: "queue.Queue[str]" = queue.Queue()
+        observer = Observer()
+        observer.schedule(_ChangeCollector(events), str(self.project_root), recursive=True)
+        observer.start()
+        print("Watching for file changes (Ctrl+C to stop)...")
+        
+        try:
+            while True:
+                pending = {events.get()}
+                # Coalesce bursts (editor saves, checkouts) into one sync
+                while True:
+                    try:
+                        pending.add(events.get(timeout=WATCH_DEBOUNCE_SECONDS))
+                    except queue.Empty:
+                        break
+                try:
+                    self.sync_event_paths(pending)
+                except Exception as e:
+                    print(f"Error in watch mode: {e}")
+        except KeyboardInterrupt:
+            print("\nWatch mode stopped")
+        finally:
+            observer.stop()
+            observer.join()
+    
+    def sync_event_paths(self, paths: Set[str]) -> None:
+        """Sync meta for absolute paths reported by the filesystem watcher."""
+        root_prefix = self._root_prefix
+        synced = 0
+        to_sync = []
+        for path in paths:
+            if not path.startswith(root_prefix) or not self.generator.should_track_file(path):
+                continue
+            file_path = Path(path)
+            relative_path = path[self._root_prefix_len:]
+            
+            if file_path.is_file():
+                stat = file_path.stat()
+                current_hash = self.calculate_file_hash(file_path, stat)
+                cached = self.file_hashes.get(relative_path)
+                self.set_file_hash(relative_path, _cache_entry(current_hash, stat))
+                if not cached or cached['h'] != current_hash:
+                    to_sync.append(relative_path)
+                    self._pending_stats[relative_path] = stat
+            elif self.drop_file_hash(relative_path):
+                logger.debug("File deleted: %s", relative_path)
+                self.remove_meta_for_files([relative_path])
+                synced += 1
+        
+        if to_sync:
+            synced += self.sync_meta_for_files(to_sync)
+        if synced:
+            self.generator.generate_index()
+            self.mark_synced()
+            self.update_sync_status("clean")
+            self.save_cache()
+            print(f"Synced {synced} changed files")
+    
+    def watch_poll_mode(self, interval: int = 30) -> None:
+        """Poll for file changes every interval seconds and auto-sync."""
         print(f"Starting watch mode with {interval}s interval...")
         print("Press Ctrl+C to stop")
         
@@ -260,14 +650,26 @@ class AxiomSync:
     
     def check_sync_status(self) -> str:
         """Check current sync status."""
-        index_path = self.project_root / ".axiom" / "index.yml"
+        index_path = self.index_path
         
         if not index_path.exists():
             return "not_initialized"
         
+        # A plain --scan rewrites index.yml without touching sync.status, so
+        # the status file only wins when it is at least as new as the index
         try:
+            status_is_current = self.status_file.stat().st_mtime_ns >= index_path.stat().st_mtime_ns
+        except OSError:
+            status_is_current = False
+        if status_is_current:
+            status = self.read_status_file()
+            if status:
+                return status
+        
+        try:
+            # Projects synced before sync.status existed, or rescanned since
             with open(index_path, 'r') as f:
-                index = yaml.safe_load(f) or {}
+                index = yaml.load(f, Loader=_Loader) or {}
             
             status = index.get('meta_files', {}).get('sync_status', 'unknown')
             return status
@@ -285,8 +687,9 @@ class AxiomSync:
             return
         
         # Update hash and sync
-        current_hash = self.calculate_file_hash(full_path)
-        self.file_hashes[file_path] = current_hash
+        stat = full_path.stat()
+        self.set_file_hash(file_path, _cache_entry(self.calculate_file_hash(full_path, stat), stat))
+        self._pending_stats[file_path] = stat
         
         if self.sync_meta_for_file(file_path):
             self.generator.generate_index()
@@ -307,14 +710,20 @@ def main():
                        help='Perform incremental sync')
     parser.add_argument('--watch', action='store_true',
                        help='Watch for changes and auto-sync')
+    parser.add_argument('--watch-poll', action='store_true',
+                       help='Watch by polling every --interval seconds instead of filesystem events')
     parser.add_argument('--interval', type=int, default=30,
-                       help='Watch interval in seconds (default: 30)')
+                       help='Watch poll interval in seconds (default: 30)')
     parser.add_argument('--status', action='store_true',
                        help='Check sync status')
     parser.add_argument('--force-file', type=str,
                        help='Force sync specific file')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Report every file as it is synced')
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s')
     
     # Create sync instance
     sync = AxiomSync(args.project_root)
@@ -323,6 +732,8 @@ def main():
         if args.status:
             status = sync.check_sync_status()
             print(f"Sync status: {status}")
+            if sync.file_hashes:
+                print(f"Tree hash: {sync.tree_hash()}")
             
             if status == "clean":
                 print("✅ All meta files are synchronized")
@@ -338,6 +749,9 @@ def main():
         elif args.force_file:
             sync.force_file_sync(args.force_file)
             
+        elif args.watch_poll:
+            sync.watch_poll_mode(args.interval)
+            
         elif args.watch:
             sync.watch_mode(args.interval)
             
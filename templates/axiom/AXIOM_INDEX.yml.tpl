@@ -1,6 +1,7 @@
 # .axiom/index.yml
 # Central index for AI-optimized codebase understanding
 # This file enables rapid context gathering and token-efficient file discovery
+# The same index is written as .axiom/index.json for tools that parse JSON
 
 version: "1.0"
 generated_at: "{{TIMESTAMP}}"
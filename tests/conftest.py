@@ -5,31 +5,56 @@ Pytest configuration and shared fixtures for the test suite.
 
 import os
 import sys
-import tempfile
-import shutil
+import importlib.util
 import pytest
 from pathlib import Path
+from types import MappingProxyType
+
+# Sample projects copied into tmp dirs by the tests, not test modules themselves
+collect_ignore = ["fixtures"]
 
-# Add the scripts directory to Python path
 TEST_DIR = Path(__file__).parent
 PROJECT_ROOT = TEST_DIR.parent
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 
-sys.path.insert(0, str(SCRIPTS_DIR))
+# Seconds the tests wait on an init-axiom.sh run; CI raises it with AXIOM_INIT_TIMEOUT
+INIT_TIMEOUT = int(os.environ.get("AXIOM_INIT_TIMEOUT", "5"))
+
+
+def _register_script_module(module_name, file_name):
+    """Import a hyphenated script from scripts/ under an importable module name."""
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / file_name)
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so the scan's process pool can pickle its workers
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+
+# Loaded once for the whole session; test modules import it by name
+_register_script_module("axiom_meta_generator", "axiom-meta-generator.py")
+_register_script_module("axiom_init", "axiom-init.py")
+# Imports axiom_meta_generator by name, so registered after it
+_register_script_module("axiom_sync", "axiom-sync.py")
+
+
+def write_files(root, files: dict):
+    """Create {relative_path: content} files under root, making each directory once."""
+    full_paths = {relative_path: os.path.join(root, relative_path) for relative_path in files}
+    for directory in {os.path.dirname(full_path) for full_path in full_paths.values()}:
+        os.makedirs(directory, exist_ok=True)
+    for relative_path, content in files.items():
+        with open(full_paths[relative_path], 'w') as f:
+            f.write(content)
 
 
 @pytest.fixture
-def temp_project_dir():
-    """Create a temporary directory for testing projects."""
-    temp_dir = tempfile.mkdtemp()
-    original_cwd = os.getcwd()
-    
-    yield temp_dir
+def temp_project_dir(tmp_path, monkeypatch):
+    """Work from a temporary project directory; monkeypatch restores the cwd afterwards.
     
-    # Cleanup
-    os.chdir(original_cwd)
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
+    pytest's tmp_path retention prunes old runs, so there is no per-test rmtree.
+    """
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -62,11 +87,33 @@ def templates_dir(project_root):
     return templates_path
 
 
+@pytest.fixture(scope="session")
+def command_inventory():
+    """Read-only {name: (path, content, stat_result)} for command and PRP template files.
+    
+    Built once per session so tests checking the committed documents share one scan.
+    """
+    inventory = {}
+    for directory in (PROJECT_ROOT / ".claude" / "commands", PROJECT_ROOT / "PRPs" / "templates"):
+        for path in sorted(directory.glob("*.md")):
+            inventory[path.name] = (path, path.read_text(), path.stat())
+    return MappingProxyType(inventory)
+
+
+@pytest.fixture(scope="session")
+def template_sources():
+    """Read-only {destination: bytes} for the files init copies into a project, read once."""
+    sources = {
+        f".claude/commands/{path.name}": path.read_bytes()
+        for path in sorted((PROJECT_ROOT / ".claude" / "commands").glob("*.md"))
+    }
+    sources["CLAUDE.md"] = (PROJECT_ROOT / "CLAUDE_MD_FOR_USER.md").read_bytes()
+    return MappingProxyType(sources)
+
+
 @pytest.fixture
 def sample_python_project(temp_project_dir):
     """Create a sample Python project for testing."""
-    os.chdir(temp_project_dir)
-    
     # Create directory structure
     directories = ["src", "tests", "docs"]
     for directory in directories:
@@ -155,8 +202,6 @@ python -m src.main
 @pytest.fixture
 def sample_javascript_project(temp_project_dir):
     """Create a sample JavaScript project for testing."""
-    os.chdir(temp_project_dir)
-    
     # Create directory structure
     directories = ["src", "tests", "public"]
     for directory in directories:
@@ -262,9 +307,8 @@ npm test
 
 @pytest.fixture
 def axiom_meta_generator():
-    """Import and return AxiomMetaGenerator class."""
-    from axiom_meta_generator import AxiomMetaGenerator
-    return AxiomMetaGenerator
+    """Return the AxiomMetaGenerator class."""
+    return sys.modules["axiom_meta_generator"].AxiomMetaGenerator
 
 
 def pytest_configure(config):
@@ -0,0 +1,4 @@
+from src.main import main
+
+def test_main():
+    assert main() is None
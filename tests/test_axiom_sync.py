@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test suite for axiom-sync.py
+Tests change detection and meta synchronization across sync runs.
+"""
+
+import os
+import json
+import yaml
+import pytest
+from pathlib import Path
+
+from conftest import write_files
+
+# Registered from scripts/axiom-sync.py by conftest.py
+_sync_module = pytest.importorskip("axiom_sync")
+AxiomSync = _sync_module.AxiomSync
+
+# Verification reads go through LibYAML when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def indexed_files(root) -> set:
+    """Return every file listed in the categories of root's index.yml."""
+    with open(Path(root) / ".axiom" / "index.yml", 'r') as f:
+        index = yaml.load(f, Loader=SafeLoader)
+    return {path for category in index['file_categories'].values() for path in category['files']}
+
+
+class TestAxiomSync:
+    """Test suite for AxiomSync change detection and syncing."""
+    
+    @pytest.fixture(autouse=True)
+    def project_dir(self, tmp_path):
+        """Set up a small project in pytest's per-test temporary directory."""
+        self.test_dir = tmp_path
+        write_files(tmp_path, {
+            "src/a.py": "import os\n",
+            "src/b.py": "import sys\n",
+            "README.md": "# Test Project\n",
+        })
+        return tmp_path
+    
+    def meta_path(self, relative_path: str) -> Path:
+        """Return the meta file path for a project-relative source path."""
+        return self.test_dir / ".axiom" / "meta" / f"{relative_path}.yml"
+    
+    def test_full_sync_creates_meta(self):
+        """Test that a first full sync generates meta and an index for every file."""
+        AxiomSync(self.test_dir).full_sync()
+        
+        for relative_path in ("src/a.py", "src/b.py", "README.md"):
+            assert self.meta_path(relative_path).exists()
+        assert indexed_files(self.test_dir) == {"src/a.py", "src/b.py", "README.md"}
+    
+    def test_deletion_seen_by_incremental_then_full_sync(self):
+        """Test that meta of a file deleted before an incremental sync is not left behind."""
+        AxiomSync(self.test_dir).full_sync()
+        
+        (self.test_dir / "src" / "a.py").unlink()
+        AxiomSync(self.test_dir).incremental_sync()
+        AxiomSync(self.test_dir).full_sync()
+        
+        assert not self.meta_path("src/a.py").exists()
+        assert self.meta_path("src/b.py").exists()
+        assert indexed_files(self.test_dir) == {"src/b.py", "README.md"}
+
+    
+    def test_status_file_older_than_index_is_ignored(self):
+        """Test that a status left by an interrupted sync gives way to a later plain scan."""
+        sync = AxiomSync(self.test_dir)
+        sync.full_sync()
+        sync.update_sync_status("syncing")
+        assert sync.check_sync_status() == "syncing"
+        
+        # What --scan does: regenerate the index, leaving sync.status alone
+        status_mtime_ns = sync.status_file.stat().st_mtime_ns
+        sync.generator.generate_index()
+        os.utime(sync.index_path, ns=(status_mtime_ns + 10**9, status_mtime_ns + 10**9))
+        
+        assert sync.check_sync_status() == "clean"
+    
+    def test_rename_reuses_cached_hash(self, monkeypatch):
+        """Test that a renamed file keeps its hash without being read again."""
+        sync = AxiomSync(self.test_dir)
+        sync.full_sync()
+        old_entry = sync.file_hashes["src/a.py"]
+        
+        (self.test_dir / "src" / "a.py").rename(self.test_dir / "src" / "c.py")
+        hashed = []
+        original_hash = sync.calculate_file_hash
+        monkeypatch.setattr(sync, "calculate_file_hash",
+                            lambda path, stat=None: hashed.append(path) or original_hash(path, stat))
+        changed, deleted = sync.scan_for_changes()
+        
+        assert changed == {"src/c.py"}
+        assert deleted == {"src/a.py"}
+        assert hashed == []
+        assert sync.file_hashes["src/c.py"]["h"] == old_entry["h"]
+        assert "src/a.py" not in sync.file_hashes
+    
+    def test_rename_synced_by_incremental_sync(self):
+        """Test that an incremental sync moves a renamed file's meta to its new path."""
+        AxiomSync(self.test_dir).full_sync()
+        
+        (self.test_dir / "src" / "a.py").rename(self.test_dir / "src" / "c.py")
+        AxiomSync(self.test_dir).incremental_sync()
+        
+        assert self.meta_path("src/c.py").exists()
+        assert not self.meta_path("src/a.py").exists()
+        assert indexed_files(self.test_dir) == {"src/b.py", "src/c.py", "README.md"}
+    
+    def test_deep_edit_changes_tree_hash(self):
+        """Test that editing a nested file changes the tree hash and only its ancestors' digests."""
+        write_files(self.test_dir, {"src/pkg/sub/deep.py": "x = 1\n", "lib/other.py": "y = 2\n"})
+        sync = AxiomSync(self.test_dir)
+        sync.full_sync()
+        tree_before = sync.tree_hash()
+        lib_before = sync.dir_hashes["lib"]
+        
+        (self.test_dir / "src" / "pkg" / "sub" / "deep.py").write_text("x = 2  # edited\n")
+        changed, _ = sync.scan_for_changes()
+        
+        assert changed == {"src/pkg/sub/deep.py"}
+        for directory in ("", "src", "src/pkg", "src/pkg/sub"):
+            assert directory not in sync.dir_hashes
+        assert sync.dir_hashes["lib"] == lib_before
+        tree_after = sync.tree_hash()
+        assert tree_after != tree_before
+        
+        # The incrementally maintained digest matches one computed from scratch
+        sync.dir_hashes.clear()
+        assert sync.tree_hash() == tree_after
+    
+    def test_same_tick_addition_not_hidden_by_listing_cache(self):
+        """Test that a file added without moving a freshly listed directory's mtime is found."""
+        sync = AxiomSync(self.test_dir)
+        sync.full_sync()
+        src = self.test_dir / "src"
+        src_stat = src.stat()
+        
+        # A coarse timestamp: the directory's mtime does not move for the addition
+        (src / "d.py").write_text("import json\n")
+        os.utime(src, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        changed, _ = sync.scan_for_changes()
+        
+        assert changed == {"src/d.py"}
+    
+    def test_old_listing_reused(self):
+        """Test that a directory listed outside the racy window is not listed again."""
+        src = self.test_dir / "src"
+        old_ns = src.stat().st_mtime_ns - 10 * 10**9
+        os.utime(src, ns=(old_ns, old_ns))
+        sync = AxiomSync(self.test_dir)
+        sync.scan_for_changes()
+        assert str(src) in sync._dir_listings
+        
+        # Direct edits of listed files are still seen, as every file is stat-ed
+        (src / "a.py").write_text("import os, re\n")
+        os.utime(src, ns=(old_ns, old_ns))
+        changed, _ = sync.scan_for_changes()
+        assert changed == {"src/a.py"}
+    
+    @pytest.mark.parametrize("legacy_name,legacy_data", [
+        # Before versioned caches: YAML mapping path -> sha256
+        ("sync_cache.yml", {'file_hashes': {"src/a.py": "0" * 64}, 'last_sync_time': "2024-01-01T00:00:00"}),
+        # Version 1 JSON caches hashed with sha256
+        ("sync_cache.json", {'version': 1, 'file_hashes': {"src/a.py": {'h': "0" * 64, 's': 10, 'm': 0}}}),
+    ], ids=["yaml", "json-v1"])
+    def test_cache_migration(self, legacy_name, legacy_data):
+        """Test that an old cache is discarded, every file resynced and a v2 JSON cache saved."""
+        cache_dir = self.test_dir / ".axiom" / "cache"
+        cache_dir.mkdir(parents=True)
+        if legacy_name.endswith(".yml"):
+            (cache_dir / legacy_name).write_text(yaml.safe_dump(legacy_data))
+        else:
+            (cache_dir / legacy_name).write_text(json.dumps(legacy_data))
+        
+        sync = AxiomSync(self.test_dir)
+        assert sync.file_hashes == {}
+        changed, _ = sync.scan_for_changes()
+        assert changed == {"src/a.py", "src/b.py", "README.md"}
+        sync.mark_synced()
+        sync.save_cache()
+        
+        cache = json.loads((cache_dir / "sync_cache.json").read_text())
+        assert cache['version'] == _sync_module.CACHE_VERSION == 2
+        assert set(cache['file_hashes']) == {"src/a.py", "src/b.py", "README.md"}
+        assert cache['tree_hash'] == sync.tree_hash()
+        assert not (cache_dir / "sync_cache.yml").exists()
+        
+        # The migrated cache is used as is by the next run
+        assert AxiomSync(self.test_dir).scan_for_changes() == (set(), set())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
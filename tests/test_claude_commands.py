@@ -4,33 +4,158 @@ Test suite for Claude slash commands
 Tests the functionality and integration of PRP generation and execution commands.
 """
 
-import os
-import tempfile
-import shutil
+import io
+import tarfile
 import pytest
 from pathlib import Path
 import yaml
 
+# YAML reads and fixture dumps go through LibYAML when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+
+# The repository layout doesn't move during a run, so paths are resolved once
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_COMMANDS_DIR = _REPO_ROOT / ".claude" / "commands"
+_COMMAND_MD_FILES = sorted(_COMMANDS_DIR.glob("*.md"))
+
+
+# Required substrings per command file, checked together so a failure lists all of them
+_PRP_NEEDLES = frozenset({
+    # Required sections
+    "# Create PRP", "## Research Process", "## PRP Generation", "## Output", "## Quality Checklist",
+    # Key instructions
+    "Research", "Plan", "Implement", "ULTRATHINK", "validation gates",
+})
+_PRP_PRO_NEEDLES = frozenset({
+    # Required sections
+    "# NAME", "generate-prp-pro", "# DESCRIPTION", "# PROMPT",
+    # Workflow steps
+    "Step 1: AI-Optimized Context Analysis",
+    "Step 2: Generate a Dynamic Questionnaire",
+    "Step 3: Interactive Dialogue",
+    "Step 4: Synthesize AI-Optimized PRP",
+    "Step 5: Final Output & Axiom Integration",
+    # Axiom Protocol integration
+    ".axiom/index.yml", ".axiom/meta/", "AXIOM_REQUIREMENTS", "meta file updates",
+})
+_EXEC_NEEDLES = frozenset({
+    # Required sections
+    "# Execute BASE PRP", "## AI-Optimized Execution Process", "## Axiom Protocol Requirements",
+    # Execution steps
+    "Load PRP & Axiom Context",
+    "ULTRATHINK with AI Context",
+    "Execute with Meta Maintenance",
+    "Validate & Sync",
+    "Complete with Axiom Verification",
+    # Axiom integration
+    ".axiom/index.yml", "meta files", "axiom-meta-generator.py", "contract.yml",
+})
+
+
+def _missing(content: str, needles: frozenset) -> set:
+    """Return the needles that do not occur in content."""
+    return {needle for needle in needles if needle not in content}
+
+
+# Mock axiom project written by TestAxiomCommandIntegration; the dicts never
+# change, so they are dumped once here rather than for every test
+_INDEX_DICT = {
+    'version': '1.0',
+    'project_context': {
+        'name': 'test-project',
+        'goal': 'Test project for axiom protocol',
+        'ai_optimization_level': 'high',
+        'token_budget_per_session': 100000
+    },
+    'file_categories': {
+        'core_modules': {'files': [], 'estimated_tokens': 0},
+        'feature_modules': {'files': [], 'estimated_tokens': 0},
+        'config_files': {'files': [], 'estimated_tokens': 0},
+        'test_files': {'files': [], 'estimated_tokens': 0}
+    },
+    'meta_files': {
+        'total_count': 0,
+        'last_updated': '2023-01-01T00:00:00',
+        'sync_status': 'clean'
+    }
+}
+
+_MANIFEST_DICT = {
+    'version': '1.0',
+    'project': {
+        'name': 'test-project',
+        'goal': 'Test project',
+        'stack': ['Python']
+    },
+    'commands': {
+        'install': 'pip install -r requirements.txt',
+        'run': 'python main.py',
+        'test': 'pytest',
+        'lint': 'ruff check'
+    }
+}
+
+_META_DICT = {
+    'version': '1.0',
+    'file_info': {
+        'path': 'main.py',
+        'type': 'module',
+        'language': 'python',
+        'size_bytes': 50,
+        'estimated_tokens': 20
+    },
+    'ai_summary': {
+        'purpose': 'Main application entry point',
+        'importance': 'core',
+        'complexity': 'low'
+    }
+}
+
+_INDEX_YAML = yaml.dump(_INDEX_DICT, Dumper=SafeDumper).encode()
+_MANIFEST_YAML = yaml.dump(_MANIFEST_DICT, Dumper=SafeDumper).encode()
+_META_YAML = yaml.dump(_META_DICT, Dumper=SafeDumper).encode()
+_MAIN_PY = b"def main():\n    print('Hello')\n\nif __name__ == '__main__':\n    main()"
+
+
+def _build_fixture_tar() -> bytes:
+    """Pack the mock project into an in-memory tar, extracted in one call per test."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for directory in (".axiom", ".axiom/meta", ".axiom/cache"):
+            info = tarfile.TarInfo(directory)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            tar.addfile(info)
+        for name, data in ((".axiom/index.yml", _INDEX_YAML),
+                           (".axiom-manifest.yml", _MANIFEST_YAML),
+                           ("main.py", _MAIN_PY),
+                           (".axiom/meta/main.py.yml", _META_YAML)):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+_FIXTURE_TAR = _build_fixture_tar()
+# The "data" filter exists from Python 3.11.4 / 3.12 on; older versions extract as-is
+_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
 
 class TestClaudeCommands:
     """Test suite for Claude slash commands."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        
-        # Get command file paths
-        self.commands_dir = Path(__file__).parent.parent / ".claude" / "commands"
-        assert self.commands_dir.exists(), f"Commands directory not found at {self.commands_dir}"
-        
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    @classmethod
+    def setup_class(cls):
+        """Check the command directory once for the class."""
+        cls.commands_dir = _COMMANDS_DIR
+        assert cls.commands_dir.exists(), f"Commands directory not found at {cls.commands_dir}"
     
-    def test_command_files_exist(self):
+    def test_command_files_exist(self, command_inventory):
         """Test that all expected command files exist."""
         expected_commands = [
             "generate-prp.md",
@@ -39,104 +164,50 @@ class TestClaudeCommands:
         ]
         
         for command in expected_commands:
-            command_file = self.commands_dir / command
-            assert command_file.exists(), f"Command file {command} not found"
-            assert command_file.stat().st_size > 0, f"Command file {command} is empty"
+            assert command in command_inventory, f"Command file {command} not found"
+            _, _, st = command_inventory[command]
+            assert st.st_size > 0, f"Command file {command} is empty"
     
-    def test_generate_prp_command_structure(self):
+    def test_generate_prp_command_structure(self, command_inventory):
         """Test the structure and content of generate-prp.md command."""
-        command_file = self.commands_dir / "generate-prp.md"
-        
-        with open(command_file, 'r') as f:
-            content = f.read()
+        _, content, _ = command_inventory["generate-prp.md"]
         
-        # Check for required sections
-        assert "# Create PRP" in content
-        assert "## Research Process" in content
-        assert "## PRP Generation" in content
-        assert "## Output" in content
-        assert "## Quality Checklist" in content
-        
-        # Check for key instructions
-        assert "Research" in content
-        assert "Plan" in content
-        assert "Implement" in content
-        assert "ULTRATHINK" in content
-        assert "validation gates" in content
+        missing = _missing(content, _PRP_NEEDLES)
+        assert not missing, f"generate-prp.md is missing {sorted(missing)}"
     
-    def test_generate_prp_pro_command_structure(self):
+    def test_generate_prp_pro_command_structure(self, command_inventory):
         """Test the structure and content of generate-prp-pro.md command."""
-        command_file = self.commands_dir / "generate-prp-pro.md"
-        
-        with open(command_file, 'r') as f:
-            content = f.read()
-        
-        # Check for required sections
-        assert "# NAME" in content
-        assert "generate-prp-pro" in content
-        assert "# DESCRIPTION" in content
-        assert "# PROMPT" in content
+        _, content, _ = command_inventory["generate-prp-pro.md"]
         
-        # Check for workflow steps
-        assert "Step 1: AI-Optimized Context Analysis" in content
-        assert "Step 2: Generate a Dynamic Questionnaire" in content
-        assert "Step 3: Interactive Dialogue" in content
-        assert "Step 4: Synthesize AI-Optimized PRP" in content
-        assert "Step 5: Final Output & Axiom Integration" in content
-        
-        # Check for Axiom Protocol integration
-        assert ".axiom/index.yml" in content
-        assert ".axiom/meta/" in content
-        assert "AXIOM_REQUIREMENTS" in content
-        assert "meta file updates" in content
+        missing = _missing(content, _PRP_PRO_NEEDLES)
+        assert not missing, f"generate-prp-pro.md is missing {sorted(missing)}"
     
-    def test_execute_prp_command_structure(self):
+    def test_execute_prp_command_structure(self, command_inventory):
         """Test the structure and content of execute-prp.md command."""
-        command_file = self.commands_dir / "execute-prp.md"
-        
-        with open(command_file, 'r') as f:
-            content = f.read()
-        
-        # Check for required sections
-        assert "# Execute BASE PRP" in content
-        assert "## AI-Optimized Execution Process" in content
-        assert "## Axiom Protocol Requirements" in content
+        _, content, _ = command_inventory["execute-prp.md"]
         
-        # Check for execution steps
-        assert "Load PRP & Axiom Context" in content
-        assert "ULTRATHINK with AI Context" in content
-        assert "Execute with Meta Maintenance" in content
-        assert "Validate & Sync" in content
-        assert "Complete with Axiom Verification" in content
-        
-        # Check for Axiom integration
-        assert ".axiom/index.yml" in content
-        assert "meta files" in content
-        assert "axiom-meta-generator.py" in content
-        assert "contract.yml" in content
+        missing = _missing(content, _EXEC_NEEDLES)
+        assert not missing, f"execute-prp.md is missing {sorted(missing)}"
     
-    def test_command_file_format(self):
+    @pytest.mark.parametrize("command_file", _COMMAND_MD_FILES, ids=lambda p: p.name)
+    def test_command_file_format(self, command_inventory, command_file):
         """Test that command files follow proper markdown format."""
-        for command_file in self.commands_dir.glob("*.md"):
-            with open(command_file, 'r') as f:
-                content = f.read()
-            
-            # Should start with markdown header
-            lines = content.split('\n')
-            assert lines[0].startswith('#'), f"Command {command_file.name} should start with markdown header"
-            
-            # Should have proper markdown structure
-            assert '##' in content or '#' in content, f"Command {command_file.name} should have structured sections"
+        _, content, _ = command_inventory[command_file.name]
+        
+        # Should start with markdown header
+        lines = content.split('\n')
+        assert lines[0].startswith('#'), f"Command {command_file.name} should start with markdown header"
+        
+        # Should have proper markdown structure
+        assert '##' in content or '#' in content, f"Command {command_file.name} should have structured sections"
     
-    def test_prp_generation_workflow_consistency(self):
+    def test_prp_generation_workflow_consistency(self, command_inventory):
         """Test that PRP generation commands have consistent workflow."""
         # Check generate-prp.md
-        with open(self.commands_dir / "generate-prp.md", 'r') as f:
-            generate_content = f.read()
+        _, generate_content, _ = command_inventory["generate-prp.md"]
         
-        # Check generate-prp-pro.md  
-        with open(self.commands_dir / "generate-prp-pro.md", 'r') as f:
-            generate_pro_content = f.read()
+        # Check generate-prp-pro.md
+        _, generate_pro_content, _ = command_inventory["generate-prp-pro.md"]
         
         # Both should mention research phase
         assert "research" in generate_content.lower()
@@ -150,12 +221,9 @@ class TestClaudeCommands:
         assert ".axiom" in generate_pro_content
         assert "meta" in generate_pro_content
         
-    def test_execute_prp_axiom_integration(self):
+    def test_execute_prp_axiom_integration(self, command_inventory):
         """Test that execute-prp command properly integrates with Axiom Protocol."""
-        command_file = self.commands_dir / "execute-prp.md"
-        
-        with open(command_file, 'r') as f:
-            content = f.read()
+        _, content, _ = command_inventory["execute-prp.md"]
         
         # Should check .axiom context first
         assert ".axiom/index.yml" in content
@@ -181,51 +249,28 @@ class TestClaudeCommands:
 class TestPRPTemplateIntegration:
     """Test integration with PRP templates."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        
-        # Get template paths
-        self.prp_templates_dir = Path(__file__).parent.parent / "PRPs" / "templates"
-        
-    def teardown_method(self):
-        """Clean up."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-    
-    def test_prp_base_template_exists(self):
+    def test_prp_base_template_exists(self, command_inventory):
         """Test that PRP base template exists and has proper structure."""
-        template_file = self.prp_templates_dir / "prp_base.md"
-        
-        if template_file.exists():
-            with open(template_file, 'r') as f:
-                content = f.read()
+        if "prp_base.md" in command_inventory:
+            _, content, _ = command_inventory["prp_base.md"]
             
             # Should have standard PRP sections
             expected_sections = ["CONTEXT", "TASK", "PERSONA", "FORMAT"]
             for section in expected_sections:
                 assert f"## {section}" in content or f"# {section}" in content
     
-    def test_commands_reference_templates(self):
+    def test_commands_reference_templates(self, command_inventory):
         """Test that commands properly reference PRP templates."""
-        commands_dir = Path(__file__).parent.parent / ".claude" / "commands"
-        
         # Check generate-prp.md
-        generate_file = commands_dir / "generate-prp.md"
-        if generate_file.exists():
-            with open(generate_file, 'r') as f:
-                content = f.read()
+        if "generate-prp.md" in command_inventory:
+            _, content, _ = command_inventory["generate-prp.md"]
             
             # Should reference template
             assert "prp_base.md" in content or "template" in content.lower()
         
         # Check generate-prp-pro.md
-        generate_pro_file = commands_dir / "generate-prp-pro.md"
-        if generate_pro_file.exists():
-            with open(generate_pro_file, 'r') as f:
-                content = f.read()
+        if "generate-prp-pro.md" in command_inventory:
+            _, content, _ = command_inventory["generate-prp-pro.md"]
             
             # Should reference template
             assert "prp_base.md" in content or "template" in content.lower()
@@ -234,165 +279,79 @@ class TestPRPTemplateIntegration:
 class TestAxiomCommandIntegration:
     """Test integration between commands and Axiom Protocol."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def mock_project(self, tmp_path):
         """Set up test environment with initialized axiom project."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
+        self.test_dir = str(tmp_path)
         
         # Create a mock axiom project
         self.create_mock_axiom_project()
-        
-    def teardown_method(self):
-        """Clean up."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        return tmp_path
     
     def create_mock_axiom_project(self):
         """Create a mock project with axiom structure."""
-        # Create .axiom directory
-        Path(".axiom").mkdir()
-        Path(".axiom/meta").mkdir()
-        Path(".axiom/cache").mkdir()
-        
-        # Create index.yml
-        index_content = {
-            'version': '1.0',
-            'project_context': {
-                'name': 'test-project',
-                'goal': 'Test project for axiom protocol',
-                'ai_optimization_level': 'high',
-                'token_budget_per_session': 100000
-            },
-            'file_categories': {
-                'core_modules': {'files': [], 'estimated_tokens': 0},
-                'feature_modules': {'files': [], 'estimated_tokens': 0},
-                'config_files': {'files': [], 'estimated_tokens': 0},
-                'test_files': {'files': [], 'estimated_tokens': 0}
-            },
-            'meta_files': {
-                'total_count': 0,
-                'last_updated': '2023-01-01T00:00:00',
-                'sync_status': 'clean'
-            }
-        }
-        
-        with open(".axiom/index.yml", 'w') as f:
-            yaml.dump(index_content, f)
-        
-        # Create manifest
-        manifest_content = {
-            'version': '1.0',
-            'project': {
-                'name': 'test-project',
-                'goal': 'Test project',
-                'stack': ['Python']
-            },
-            'commands': {
-                'install': 'pip install -r requirements.txt',
-                'run': 'python main.py',
-                'test': 'pytest',
-                'lint': 'ruff check'
-            }
-        }
-        
-        with open(".axiom-manifest.yml", 'w') as f:
-            yaml.dump(manifest_content, f)
-        
-        # Create some source files
-        with open("main.py", 'w') as f:
-            f.write("def main():\n    print('Hello')\n\nif __name__ == '__main__':\n    main()")
-        
-        # Create corresponding meta file
-        meta_content = {
-            'version': '1.0',
-            'file_info': {
-                'path': 'main.py',
-                'type': 'module',
-                'language': 'python',
-                'size_bytes': 50,
-                'estimated_tokens': 20
-            },
-            'ai_summary': {
-                'purpose': 'Main application entry point',
-                'importance': 'core',
-                'complexity': 'low'
-            }
-        }
-        
-        with open(".axiom/meta/main.py.yml", 'w') as f:
-            yaml.dump(meta_content, f)
+        # .axiom skeleton, index, manifest, main.py and its meta file in one extract
+        with tarfile.open(fileobj=io.BytesIO(_FIXTURE_TAR)) as tar:
+            tar.extractall(self.test_dir, **_EXTRACT_KWARGS)
     
     def test_mock_project_structure(self):
         """Test that mock project has proper structure."""
-        assert Path(".axiom").exists()
-        assert Path(".axiom/index.yml").exists()
-        assert Path(".axiom-manifest.yml").exists()
-        assert Path("main.py").exists()
-        assert Path(".axiom/meta/main.py.yml").exists()
+        project = Path(self.test_dir)
+        assert (project / ".axiom").exists()
+        assert (project / ".axiom/index.yml").exists()
+        assert (project / ".axiom-manifest.yml").exists()
+        assert (project / "main.py").exists()
+        assert (project / ".axiom/meta/main.py.yml").exists()
         
         # Test that index.yml is valid
-        with open(".axiom/index.yml", 'r') as f:
-            index = yaml.safe_load(f)
+        with open(project / ".axiom/index.yml", 'r') as f:
+            index = yaml.load(f, Loader=SafeLoader)
         
         assert index['version'] == '1.0'
         assert 'project_context' in index
         assert index['meta_files']['sync_status'] == 'clean'
     
-    def test_commands_can_read_axiom_context(self):
+    @pytest.mark.parametrize("command_file", _COMMAND_MD_FILES, ids=lambda p: p.name)
+    def test_commands_can_read_axiom_context(self, command_inventory, command_file):
         """Test that commands can properly read axiom context."""
-        commands_dir = Path(__file__).parent.parent / ".claude" / "commands"
-        
         # The commands should reference reading .axiom/index.yml
-        for command_file in commands_dir.glob("*.md"):
-            with open(command_file, 'r') as f:
-                content = f.read()
-            
-            # At least one command should mention reading axiom context
-            if ".axiom" in content:
-                assert "index.yml" in content or "meta" in content
+        _, content, _ = command_inventory[command_file.name]
+        
+        # At least one command should mention reading axiom context
+        if ".axiom" in content:
+            assert "index.yml" in content or "meta" in content
 
 
 class TestCommandWorkflowIntegration:
     """Test the complete workflow from command to execution."""
     
-    def test_workflow_documentation_consistency(self):
+    @pytest.mark.parametrize("command_file", _COMMAND_MD_FILES, ids=lambda p: p.name)
+    def test_workflow_documentation_consistency(self, command_inventory, command_file):
         """Test that all commands document consistent workflow."""
-        commands_dir = Path(__file__).parent.parent / ".claude" / "commands"
-        
         workflow_keywords = [
             "research", "plan", "implement", "validate", "ultrathink"
         ]
         
-        for command_file in commands_dir.glob("*.md"):
-            with open(command_file, 'r') as f:
-                content = f.read().lower()
-            
-            # Each command should mention key workflow concepts
-            workflow_mentions = sum(1 for keyword in workflow_keywords if keyword in content)
-            assert workflow_mentions >= 2, f"Command {command_file.name} should mention workflow concepts"
+        content = command_inventory[command_file.name][1].lower()
+        
+        # Each command should mention key workflow concepts
+        workflow_mentions = sum(1 for keyword in workflow_keywords if keyword in content)
+        assert workflow_mentions >= 2, f"Command {command_file.name} should mention workflow concepts"
     
-    def test_axiom_integration_consistency(self):
+    # At least the pro and execute commands should have axiom integration
+    @pytest.mark.parametrize("command_name", ["generate-prp-pro.md", "execute-prp.md"])
+    def test_axiom_integration_consistency(self, command_inventory, command_name):
         """Test that Axiom integration is consistent across commands."""
-        commands_dir = Path(__file__).parent.parent / ".claude" / "commands"
-        
         axiom_features = [
             ".axiom", "meta", "contract", "token"
         ]
         
-        # At least the pro and execute commands should have axiom integration
-        important_commands = ["generate-prp-pro.md", "execute-prp.md"]
-        
-        for command_name in important_commands:
-            command_file = commands_dir / command_name
-            if command_file.exists():
-                with open(command_file, 'r') as f:
-                    content = f.read().lower()
-                
-                # Should mention axiom features
-                axiom_mentions = sum(1 for feature in axiom_features if feature in content)
-                assert axiom_mentions >= 2, f"Command {command_name} should have axiom integration"
+        if command_name in command_inventory:
+            content = command_inventory[command_name][1].lower()
+            
+            # Should mention axiom features
+            axiom_mentions = sum(1 for feature in axiom_features if feature in content)
+            assert axiom_mentions >= 2, f"Command {command_name} should have axiom integration"
 
 
 if __name__ == "__main__":
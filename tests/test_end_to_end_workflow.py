@@ -4,57 +4,121 @@ End-to-end integration tests for the complete Axiom Protocol workflow.
 Tests the full user journey from initialization to PRP execution.
 """
 
+import gc
+import io
+import mmap
 import os
-import sys
-import tempfile
 import shutil
 import subprocess
+import tarfile
+import time
 import pytest
+from functools import lru_cache
+import warnings
 import yaml
 from pathlib import Path
 
-# Add scripts to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+from conftest import INIT_TIMEOUT
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    warnings.warn("PyYAML was built without LibYAML; e2e YAML parsing falls back to pure Python")
 
-class TestCompleteWorkflow:
-    """Test the complete end-to-end workflow."""
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Registered from scripts/axiom-meta-generator.py by conftest.py
+AxiomMetaGenerator = pytest.importorskip("axiom_meta_generator").AxiomMetaGenerator
+
+
+INIT_SCRIPT = Path(__file__).resolve().parent.parent / "init-axiom.sh"
+
+
+def _mmap_yaml(path: str, size: int):
+    """Parse a YAML file straight from a read-only mapping of it."""
+    if not size:
+        # mmap refuses zero-length mappings
+        return None
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=_Loader)
+
+
+@lru_cache(maxsize=1024)
+def _load_yaml_cached(path: str, dev: int, ino: int, mtime_ns: int, size: int):
+    return _mmap_yaml(path, size)
+
+
+def load_yaml(path):
+    """Parse a YAML file, reusing the result while the same file's mtime and size are unchanged.
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        
-        # Get paths to key scripts and files
-        self.project_root = Path(__file__).parent.parent
-        self.init_script = self.project_root / "init-axiom.sh"
-        
-        assert self.init_script.exists(), f"Init script not found at {self.init_script}"
-        
-    def teardown_method(self):
-        """Clean up."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    Callers must not mutate the returned data, since it is shared between calls.
+    """
+    # Relative paths name a different file in each project; copytree copies
+    # keep mtime and size, so the real path and inode tell them apart
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    # Size guards against rewrites landing within one mtime tick
+    return _load_yaml_cached(path, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def load_index():
+    """Parse .axiom/index.json, the JSON copy of .axiom/index.yml that generate_index writes.
     
-    def create_sample_project(self):
-        """Create a realistic sample project for testing."""
-        os.chdir(self.test_dir)
-        
-        # Create project structure
-        directories = [
-            "src", "src/components", "src/utils", 
-            "tests", "tests/unit", "tests/integration",
-            "docs", "config"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-        
-        # Create Python files with realistic content
-        files = {
-            "src/__init__.py": "",
-            "src/main.py": '''#!/usr/bin/env python3
+    test_index_yaml_matches_json_mirror checks the two agree.
+    """
+    with open(".axiom/index.json", 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _collect_paths(root='.'):
+    """Return every path under root, relative to it, with directories suffixed by '/'."""
+    out = set()
+    for dirpath, _dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        rel = '' if rel == '.' else rel.replace(os.sep, '/') + '/'
+        if rel:
+            out.add(rel)
+        out.update(rel + name for name in filenames)
+    return out
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
+
+
+def _write_blobs(items):
+    # Raw fds: these are small one-shot writes, so the buffered io layer is pure overhead
+    for path, data in items:
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def bulk_write(items):
+    """Write (relative_path, bytes) pairs in order, creating each parent directory only once."""
+    for directory in {os.path.dirname(path) for path, _ in items} - {''}:
+        os.makedirs(directory, exist_ok=True)
+    _write_blobs(items)
+
+
+# Sample project layout, pre-encoded once at import
+_SAMPLE_DIRS = (
+    "src", "src/components", "src/utils",
+    "tests", "tests/unit", "tests/integration",
+    "docs", "config",
+)
+
+_SAMPLE_FILES = tuple((path, content.encode()) for path, content in {
+    "src/__init__.py": "",
+    "src/main.py": '''#!/usr/bin/env python3
 """Main application entry point."""
 
 import sys
@@ -71,8 +135,8 @@ def main():
 if __name__ == "__main__":
     sys.exit(main())
 ''',
-            "src/components/__init__.py": "",
-            "src/components/app.py": '''"""Application main class."""
+    "src/components/__init__.py": "",
+    "src/components/app.py": '''"""Application main class."""
 
 import logging
 from typing import Dict, Any
@@ -91,8 +155,8 @@ class Application:
         # Main application logic would go here
         return 0
 ''',
-            "src/utils/__init__.py": "",
-            "src/utils/config.py": '''"""Configuration utilities."""
+    "src/utils/__init__.py": "",
+    "src/utils/config.py": '''"""Configuration utilities."""
 
 import os
 import yaml
@@ -119,9 +183,9 @@ def get_default_config() -> Dict[str, Any]:
         "log_level": "INFO"
     }
 ''',
-            "tests/__init__.py": "",
-            "tests/unit/__init__.py": "",
-            "tests/unit/test_app.py": '''"""Tests for Application class."""
+    "tests/__init__.py": "",
+    "tests/unit/__init__.py": "",
+    "tests/unit/test_app.py": '''"""Tests for Application class."""
 
 import pytest
 from src.components.app import Application
@@ -139,7 +203,7 @@ def test_application_run():
     result = app.run()
     assert result == 0
 ''',
-            "tests/unit/test_config.py": '''"""Tests for config utilities."""
+    "tests/unit/test_config.py": '''"""Tests for config utilities."""
 
 import pytest
 from src.utils.config import get_default_config, load_config
@@ -156,7 +220,7 @@ def test_load_config_default():
     config = load_config("nonexistent.yml")
     assert config == get_default_config()
 ''',
-            "config/config.yml": '''app_name: "sample-app"
+    "config/config.yml": '''app_name: "sample-app"
 version: "1.0.0"
 debug: false
 log_level: "INFO"
@@ -165,11 +229,11 @@ database:
   port: 5432
   name: "sampledb"
 ''',
-            "requirements.txt": '''pytest>=6.0.0
+    "requirements.txt": '''pytest>=6.0.0
 pytest-cov>=2.0.0
 pyyaml>=5.4.0
 ''',
-            "setup.py": '''from setuptools import setup, find_packages
+    "setup.py": '''from setuptools import setup, find_packages
 
 setup(
     name="sample-app",
@@ -191,7 +255,7 @@ setup(
     },
 )
 ''',
-            "README.md": '''# Sample Application
+    "README.md": '''# Sample Application
 
 This is a sample application created to test the Axiom Protocol framework.
 
@@ -220,7 +284,7 @@ python -m src.main
 pytest tests/
 ```
 ''',
-            ".gitignore": '''__pycache__/
+    ".gitignore": '''__pycache__/
 *.py[cod]
 *$py.class
 *.so
@@ -261,24 +325,189 @@ venv.bak/
 *.swo
 *~
 '''
-        }
-        
-        for file_path, content in files.items():
-            file_obj = Path(file_path)
-            file_obj.parent.mkdir(parents=True, exist_ok=True)
-            file_obj.write_text(content)
+}.items())
+
+
+def _build_sample_tar() -> bytes:
+    """Pack the sample project into an in-memory tar, extracted in one call per project."""
+    directories = set(_SAMPLE_DIRS)
+    for path, _ in _SAMPLE_FILES:
+        parent = os.path.dirname(path)
+        while parent:
+            directories.add(parent)
+            parent = os.path.dirname(parent)
+    # Stamp entries with the build time, as if the files had just been written
+    mtime = int(time.time())
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tar:
+        for directory in sorted(directories):
+            info = tarfile.TarInfo(directory)
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            info.mtime = mtime
+            tar.addfile(info)
+        for path, blob in _SAMPLE_FILES:
+            info = tarfile.TarInfo(path)
+            info.size = len(blob)
+            info.mode = 0o644
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(blob))
+    return buffer.getvalue()
+
+
+_SAMPLE_TAR = _build_sample_tar()
+# The "data" filter exists from Python 3.11.4 / 3.12 on; older versions extract as-is
+_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def create_sample_project(root):
+    """Create a realistic sample project for testing under root."""
+    with tarfile.open(fileobj=io.BytesIO(_SAMPLE_TAR)) as tar:
+        tar.extractall(root, **_EXTRACT_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def golden_project(tmp_path_factory):
+    """Build the sample project once per module, for tests to copy."""
+    root = tmp_path_factory.mktemp("golden")
+    create_sample_project(root)
+    return root
+
+
+@pytest.fixture
+def sample_project(golden_project, tmp_path, monkeypatch):
+    """Give a test its own copy of the sample project as the working directory."""
+    project = tmp_path / "proj"
+    # Real copies, not hardlinks: tests append to sources and the generator rewrites files in place
+    shutil.copytree(golden_project, project)
+    monkeypatch.chdir(project)
+    return project
+
+
+@pytest.fixture(scope="session")
+def initialized_project(tmp_path_factory):
+    """Run init-axiom.sh once on a sample project and share the result."""
+    root = tmp_path_factory.mktemp("initialized")
+    create_sample_project(root)
+    result = subprocess.run([str(INIT_SCRIPT)], cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, timeout=INIT_TIMEOUT)
+    assert result.returncode == 0, f"Initialization failed: {result.stderr}"
+    return root
+
+
+@pytest.fixture
+def initialized_shared(initialized_project, monkeypatch):
+    """Work in the shared initialized project; for tests that only read it."""
+    monkeypatch.chdir(initialized_project)
+    return initialized_project
+
+
+@pytest.fixture
+def initialized_copy(initialized_project, tmp_path, monkeypatch):
+    """Work in a private copy of the initialized project; for tests that modify it."""
+    project = tmp_path / "proj"
+    shutil.copytree(initialized_project, project, symlinks=True)
+    monkeypatch.chdir(project)
+    return project
+
+
+@pytest.fixture
+def empty_project(tmp_path, monkeypatch):
+    """Run a test from an empty temporary project directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def _no_gc():
+    """Keep the cyclic collector from pausing the heaviest, syscall- and subprocess-bound tests."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
+
+
+# Contract written by test_contract_creation_workflow, parsed once at import
+_CONTRACT_STR = '''# Contract for Application class
+summary: "Main application class that handles initialization and execution"
+component: "components"
+
+preconditions:
+  - name: "config"
+    type: "Dict[str, Any]"
+    description: "Configuration dictionary"
+
+postconditions:
+  - name: "return_code"
+    type: "int"
+    description: "Application exit code (0 for success)"
+
+invariants:
+  - "Application maintains config state throughout execution"
+  - "Logger is properly configured"
+
+dependencies:
+  internal: ["src/utils/config.py"]
+  external: ["logging", "typing"]
+'''
+_CONTRACT_YAML_BYTES = _CONTRACT_STR.encode()
+_CONTRACT_DICT = yaml.load(_CONTRACT_STR, Loader=_Loader)
+
+# Module and test file templates for test_project_scaling
+_MODULE_TPL = '''"""Module {i} implementation."""
+
+def function_{i}():
+    """Function for module {i}."""
+    return "module_{i}_result"
+
+class Class{i}:
+    """Class for module {i}."""
+    
+    def __init__(self):
+        self.value = {i}
     
-    def test_complete_initialization_workflow(self):
+    def method_{i}(self):
+        """Method for module {i}."""
+        return self.value * 2
+'''
+
+_TEST_TPL = '''"""Tests for module {i}."""
+
+import pytest
+from .module_{i} import function_{i}, Class{i}
+
+def test_function_{i}():
+    """Test function_{i}."""
+    result = function_{i}()
+    assert result == "module_{i}_result"
+
+def test_class_{i}():
+    """Test Class{i}."""
+    obj = Class{i}()
+    assert obj.value == {i}
+    assert obj.method_{i}() == {i2}
+'''
+
+
+class TestCompleteWorkflow:
+    """Test the complete end-to-end workflow."""
+    
+    @pytest.fixture(autouse=True)
+    def _init_script(self, init_script_path):
+        """Expose the init script checked by the conftest fixture."""
+        self.init_script = init_script_path
+    
+    @pytest.mark.usefixtures("_no_gc")
+    def test_complete_initialization_workflow(self, sample_project):
         """Test the complete initialization workflow."""
-        # Create sample project
-        self.create_sample_project()
-        
         # Run initialization
         result = subprocess.run(
             [str(self.init_script)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=60
+            timeout=INIT_TIMEOUT
         )
         
         # Check that initialization succeeded
@@ -291,14 +520,12 @@ venv.bak/
             ".axiom/meta/",
             ".axiom/cache/",
             ".axiom/index.yml",
+            ".axiom/index.json",
             ".claude/commands/",
             "CLAUDE.md",
             "scripts/axiom-meta-generator.py"
         ]
         
-        for path in expected_paths:
-            assert Path(path).exists(), f"Expected path {path} not found after initialization"
-        
         # Check that metadata was generated for all relevant files
         expected_meta_files = [
             ".axiom/meta/src/main.py.yml",
@@ -310,13 +537,12 @@ venv.bak/
             ".axiom/meta/requirements.txt.yml"
         ]
         
-        for meta_file in expected_meta_files:
-            assert Path(meta_file).exists(), f"Expected meta file {meta_file} not found"
-        
-        # Verify index.yml content
-        with open(".axiom/index.yml", 'r') as f:
-            index = yaml.safe_load(f)
+        # One walk and one index read feed every check below
+        existing = _collect_paths()
+        index = load_index()
         
+        missing = [path for path in expected_paths + expected_meta_files if path not in existing]
+        assert not missing, f"Expected paths not found after initialization: {missing}"
         assert index['version'] == '1.0'
         assert index['meta_files']['total_count'] > 0
         assert index['meta_files']['sync_status'] == 'clean'
@@ -335,20 +561,13 @@ venv.bak/
         assert "*.contract.yml" in gitignore_content
         assert ".axiom-manifest.yml" in gitignore_content
     
-    def test_meta_file_content_quality(self):
+    def test_meta_file_content_quality(self, initialized_shared):
         """Test that generated meta files have high-quality content."""
-        # Create and initialize project
-        self.create_sample_project()
-        
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
-        
         # Check specific meta file content
         meta_file = Path(".axiom/meta/src/components/app.py.yml")
         assert meta_file.exists()
         
-        with open(meta_file, 'r') as f:
-            meta = yaml.safe_load(f)
+        meta = load_yaml(meta_file)
         
         # Verify meta structure
         assert meta['version'] == '1.0'
@@ -381,15 +600,9 @@ venv.bak/
         imports = code_structure['imports']
         assert len(imports) > 0  # Should detect some imports
     
-    def test_token_estimation_accuracy(self):
+    def test_token_estimation_accuracy(self, initialized_shared):
         """Test that token estimations are reasonable."""
-        self.create_sample_project()
-        
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
-        
-        with open(".axiom/index.yml", 'r') as f:
-            index = yaml.safe_load(f)
+        index = load_index()
         
         # Check total token estimation
         total_tokens = 0
@@ -401,8 +614,7 @@ venv.bak/
         
         # Check individual file estimations
         meta_file = Path(".axiom/meta/src/main.py.yml")
-        with open(meta_file, 'r') as f:
-            meta = yaml.safe_load(f)
+        meta = load_yaml(meta_file)
         
         tokens = meta['file_info']['estimated_tokens']
         size_bytes = meta['file_info']['size_bytes']
@@ -410,15 +622,13 @@ venv.bak/
         # Token estimate should be reasonable relative to file size
         assert 0 < tokens < size_bytes * 2, f"Token estimation unreasonable: {tokens} for {size_bytes} bytes"
     
-    def test_file_categorization(self):
+    def test_index_yaml_matches_json_mirror(self, initialized_shared):
+        """Test that index.yml, which users and axiom-sync read, carries the same index as index.json."""
+        assert load_yaml(".axiom/index.yml") == load_index()
+    
+    def test_file_categorization(self, initialized_shared):
         """Test that files are properly categorized."""
-        self.create_sample_project()
-        
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
-        
-        with open(".axiom/index.yml", 'r') as f:
-            index = yaml.safe_load(f)
+        index = load_index()
         
         file_categories = index['file_categories']
         
@@ -440,77 +650,42 @@ venv.bak/
         config_files = file_categories['config_files']['files']
         assert any('config' in f.lower() or f.endswith('.yml') or f.endswith('.txt') for f in config_files)
     
-    def test_contract_creation_workflow(self):
+    def test_contract_creation_workflow(self, initialized_copy):
         """Test creating contract files for modules."""
-        self.create_sample_project()
-        
-        # Initialize project
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
-        
         # Create a contract file for the app module
-        contract_content = '''# Contract for Application class
-summary: "Main application class that handles initialization and execution"
-component: "components"
-
-preconditions:
-  - name: "config"
-    type: "Dict[str, Any]"
-    description: "Configuration dictionary"
-
-postconditions:
-  - name: "return_code"
-    type: "int"
-    description: "Application exit code (0 for success)"
-
-invariants:
-  - "Application maintains config state throughout execution"
-  - "Logger is properly configured"
-
-dependencies:
-  internal: ["src/utils/config.py"]
-  external: ["logging", "typing"]
-'''
+        _write_blobs([("src/components/app.contract.yml", _CONTRACT_YAML_BYTES)])
         
-        with open("src/components/app.contract.yml", 'w') as f:
-            f.write(contract_content)
+        # A rescan picks the contract up although app.py itself is unchanged
+        generator = AxiomMetaGenerator(".")
+        generator.scan_and_generate_meta()
+        meta = load_yaml(".axiom/meta/src/components/app.py.yml")
+        assert meta['contract_file'] == "src/components/app.contract.yml"
         
         # Update metadata to reflect contract
-        from axiom_meta_generator import AxiomMetaGenerator
-        
-        generator = AxiomMetaGenerator(".")
         generator.update_meta_for_file("src/components/app.py")
         generator.generate_index()
         
         # Check that contract is referenced in meta
-        with open(".axiom/meta/src/components/app.py.yml", 'r') as f:
-            meta = yaml.safe_load(f)
+        meta = load_yaml(".axiom/meta/src/components/app.py.yml")
         
         assert meta['contract_file'] == "src/components/app.contract.yml"
         
-        # Verify contract file exists and is valid
-        assert Path("src/components/app.contract.yml").exists()
-        
-        with open("src/components/app.contract.yml", 'r') as f:
-            contract = yaml.safe_load(f)
+        # Verify the contract file is intact and parses to the contract written
+        with open(meta['contract_file'], 'rb') as f:
+            assert f.read() == _CONTRACT_YAML_BYTES
+        contract = load_yaml(meta['contract_file'])
+        assert contract == _CONTRACT_DICT
         
         assert contract['summary']
         assert 'preconditions' in contract
         assert 'postconditions' in contract
         assert 'dependencies' in contract
     
-    def test_meta_synchronization(self):
+    def test_meta_synchronization(self, initialized_copy):
         """Test that meta files stay synchronized with source files."""
-        self.create_sample_project()
-        
-        # Initialize project
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
-        
         # Get initial meta timestamp
         meta_file = Path(".axiom/meta/src/main.py.yml")
-        with open(meta_file, 'r') as f:
-            initial_meta = yaml.safe_load(f)
+        initial_meta = load_yaml(meta_file)
         initial_timestamp = initial_meta['last_updated']
         
         # Modify source file
@@ -518,76 +693,35 @@ dependencies:
             f.write("\n# Added comment for testing\n")
         
         # Update meta
-        from axiom_meta_generator import AxiomMetaGenerator
         generator = AxiomMetaGenerator(".")
         generator.update_meta_for_file("src/main.py")
         
         # Check that meta was updated
-        with open(meta_file, 'r') as f:
-            updated_meta = yaml.safe_load(f)
+        updated_meta = load_yaml(meta_file)
         
         assert updated_meta['last_updated'] != initial_timestamp
         assert updated_meta['file_info']['size_bytes'] > initial_meta['file_info']['size_bytes']
     
-    def test_project_scaling(self):
+    @pytest.mark.usefixtures("_no_gc")
+    def test_project_scaling(self, empty_project):
         """Test that the system handles larger projects reasonably."""
-        # Create a larger project structure
-        os.chdir(self.test_dir)
-        
-        # Create many files to test scaling
+        # Create many files to test scaling; each module directory is created once by bulk_write
+        items = []
         for i in range(20):
-            module_dir = Path(f"module_{i}")
-            module_dir.mkdir()
-            
-            # Create main module file
-            with open(module_dir / f"module_{i}.py", 'w') as f:
-                f.write(f'''"""Module {i} implementation."""
-
-def function_{i}():
-    """Function for module {i}."""
-    return "module_{i}_result"
-
-class Class{i}:
-    """Class for module {i}."""
-    
-    def __init__(self):
-        self.value = {i}
-    
-    def method_{i}(self):
-        """Method for module {i}."""
-        return self.value * 2
-''')
-            
-            # Create test file
-            with open(module_dir / f"test_module_{i}.py", 'w') as f:
-                f.write(f'''"""Tests for module {i}."""
-
-import pytest
-from .module_{i} import function_{i}, Class{i}
-
-def test_function_{i}():
-    """Test function_{i}."""
-    result = function_{i}()
-    assert result == "module_{i}_result"
-
-def test_class_{i}():
-    """Test Class{i}."""
-    obj = Class{i}()
-    assert obj.value == {i}
-    assert obj.method_{i}() == {i * 2}
-''')
+            items.append((f"module_{i}/module_{i}.py", _MODULE_TPL.format(i=i).encode()))
+            items.append((f"module_{i}/test_module_{i}.py", _TEST_TPL.format(i=i, i2=i * 2).encode()))
+        bulk_write(items)
         
         # Create main README
         with open("README.md", 'w') as f:
             f.write("# Large Test Project\n\nThis project tests scaling with many modules.")
         
         # Initialize
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=120)
+        result = subprocess.run([str(self.init_script)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=INIT_TIMEOUT)
         assert result.returncode == 0
         
         # Check that all files were processed
-        with open(".axiom/index.yml", 'r') as f:
-            index = yaml.safe_load(f)
+        index = load_index()
         
         # Should have processed 40+ files (20 modules + 20 tests + README)
         assert index['meta_files']['total_count'] >= 40
@@ -599,36 +733,22 @@ def test_class_{i}():
         
         # Should complete in reasonable time (already tested by timeout)
         assert index['meta_files']['sync_status'] == 'clean'
+        assert load_yaml(".axiom/index.yml") == index
 
 
 class TestErrorHandling:
     """Test error handling in the workflow."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        
-        self.project_root = Path(__file__).parent.parent
-        self.init_script = self.project_root / "init-axiom.sh"
-        
-    def teardown_method(self):
-        """Clean up."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-    
-    def test_corrupted_meta_file_recovery(self):
+    def test_corrupted_meta_file_recovery(self, empty_project):
         """Test recovery from corrupted meta files."""
-        os.chdir(self.test_dir)
-        
         # Create simple project
         with open("test.py", 'w') as f:
             f.write("print('test')")
         
-        # Initialize
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
+        # Initialize in-process; the init script itself is covered by TestCompleteWorkflow
+        bootstrap = AxiomMetaGenerator(".")
+        bootstrap.scan_and_generate_meta()
+        bootstrap.generate_index()
         
         # Corrupt meta file
         meta_file = Path(".axiom/meta/test.py.yml")
@@ -636,29 +756,26 @@ class TestErrorHandling:
             f.write("invalid: yaml: content: [")
         
         # Try to regenerate
-        from axiom_meta_generator import AxiomMetaGenerator
         generator = AxiomMetaGenerator(".")
         
         # Should handle gracefully and regenerate
         generator.scan_and_generate_meta()
         
         # Meta file should be fixed
-        with open(meta_file, 'r') as f:
-            meta = yaml.safe_load(f)
+        meta = load_yaml(meta_file)
         
         assert meta['version'] == '1.0'
         assert meta['file_info']['path'] == 'test.py'
     
-    def test_missing_source_file_cleanup(self):
+    def test_missing_source_file_cleanup(self, empty_project):
         """Test cleanup of orphaned meta files."""
-        os.chdir(self.test_dir)
-        
         # Create and initialize
         with open("temp.py", 'w') as f:
             f.write("print('temp')")
         
-        result = subprocess.run([str(self.init_script)], capture_output=True, timeout=60)
-        assert result.returncode == 0
+        bootstrap = AxiomMetaGenerator(".")
+        bootstrap.scan_and_generate_meta()
+        bootstrap.generate_index()
         
         # Verify meta file exists
         meta_file = Path(".axiom/meta/temp.py.yml")
@@ -668,7 +785,6 @@ class TestErrorHandling:
         Path("temp.py").unlink()
         
         # Clean orphaned meta
-        from axiom_meta_generator import AxiomMetaGenerator
         generator = AxiomMetaGenerator(".")
         generator.clean_orphaned_meta()
         
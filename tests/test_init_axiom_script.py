@@ -2,53 +2,164 @@
 """
 Test suite for init-axiom.sh script
 Tests the initialization script functionality end-to-end.
+
+The behavioural tests run against both entry points: init-axiom.sh itself
+and scripts/axiom-init.py, its in-process Python port.
+
+The tests never use pytest's cache, so run_tests.py --script runs them as
+    pytest -p no:cacheprovider -p no:stepwise tests/test_init_axiom_script.py
 """
 
+import io
 import os
-import tempfile
+import mmap
 import shutil
 import subprocess
+from contextlib import redirect_stderr, redirect_stdout
 import pytest
 from pathlib import Path
+from typing import NamedTuple
 
+from conftest import INIT_TIMEOUT
 
-class TestInitAxiomScript:
-    """Test suite for init-axiom.sh script."""
+# Registered from scripts/axiom-init.py by conftest.py
+axiom_init = pytest.importorskip("axiom_init")
+
+# Resolved once; strict=True fails collection here if the script is missing
+SCRIPT_PATH = (Path(__file__).parent.parent / "init-axiom.sh").resolve(strict=True)
+
+# Prebuilt projects for the integration tests; conftest keeps pytest from collecting them
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# Every external command init-axiom.sh runs; a PATH holding only these lacks python3
+SCRIPT_TOOLS = ("bash", "dirname", "cp", "mkdir", "chmod", "grep")
+
+
+# Paths every init leaves behind, whatever the project contains
+EXPECTED_CORE_FILES = (
+    ".axiom-manifest.yml",
+    ".claude/commands",
+    ".claude/commands/generate-prp.md",
+    ".claude/commands/generate-prp-pro.md",
+    ".claude/commands/execute-prp.md",
+    "CLAUDE.md",
+    "scripts/axiom-meta-generator.py",
+    # .axiom directory structure
+    ".axiom",
+    ".axiom/meta",
+    ".axiom/cache",
+    ".axiom/index.yml",
+)
+
+# Scan output for the fixture projects
+EXPECTED_PY_META = (
+    ".axiom/meta/src/main.py.yml",
+    ".axiom/meta/tests/test_main.py.yml",
+    ".axiom/meta/README.md.yml",
+)
+EXPECTED_JS_META = (
+    ".axiom/meta/src/index.js.yml",
+    ".axiom/meta/tests/index.test.js.yml",
+    ".axiom/meta/package.json.yml",
+    ".axiom/meta/README.md.yml",
+)
+
+
+def collect_tree(root):
+    """Return every file and directory under root as a relative posix path, from one walk."""
+    tree = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = Path(dirpath).relative_to(root)
+        tree.update((rel / name).as_posix() for name in dirnames + filenames)
+    return tree
+
+
+def assert_tree(root, expected):
+    """Assert every expected relative path exists under root, naming all that are missing."""
+    missing = set(expected) - collect_tree(root)
+    assert not missing, f"Expected paths not found under {root}: {sorted(missing)}"
+
+
+def missing_substrings(path, needles):
+    """Return the byte strings in needles that path does not contain.
     
-    def setup_method(self):
-        """Set up test environment with temporary directory."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        
-        # Get the path to the init script
-        self.script_path = Path(__file__).parent.parent / "init-axiom.sh"
-        assert self.script_path.exists(), f"Script not found at {self.script_path}"
-        
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    Searches an mmap of the file instead of reading and decoding it; empty
+    files can't be mapped and contain nothing.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return list(needles)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return [needle for needle in needles if m.find(needle) == -1]
+
+
+class InitResult(NamedTuple):
+    """Exit code and output of one initialization."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+# "shell" runs init-axiom.sh, "port" runs axiom_init.run in-process
+ENTRY_POINTS = ("shell", "port")
+
+
+def init_project(root, entry_point="port", skip_scan=False, path=None):
+    """Initialize root through the given entry point, capturing its output.
     
-    def run_init_script(self):
-        """Run the init-axiom.sh script in the test directory."""
-        os.chdir(self.test_dir)
-        
-        # Run the script
+    skip_scan only applies to the port, path (a replacement PATH) only to
+    the script; the script skips the scan when python3 is not on PATH.
+    """
+    if entry_point == "shell":
+        assert not skip_scan, "init-axiom.sh has no skip_scan switch"
         result = subprocess.run(
-            [str(self.script_path)],
+            [str(SCRIPT_PATH)],
+            cwd=root,
             capture_output=True,
             text=True,
-            timeout=30
+            timeout=INIT_TIMEOUT,
+            env=None if path is None else {**os.environ, "PATH": str(path)}
         )
-        
-        return result
+        return InitResult(result.returncode, result.stdout, result.stderr)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        returncode = axiom_init.run(root, skip_scan=skip_scan)
+    return InitResult(returncode, stdout.getvalue(), stderr.getvalue())
+
+
+@pytest.fixture(params=ENTRY_POINTS)
+def entry_point(request):
+    """Run a test once against init-axiom.sh and once against the Python port."""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def no_python_path(tmp_path_factory):
+    """A bin directory linking only SCRIPT_TOOLS, for running init-axiom.sh without python3."""
+    bin_dir = tmp_path_factory.mktemp("no-python-bin")
+    for tool in SCRIPT_TOOLS:
+        target = shutil.which(tool)
+        if target is None:
+            pytest.skip(f"{tool} not found on PATH")
+        (bin_dir / tool).symlink_to(target)
+    return bin_dir
+
+
+class TestInitAxiomScript:
+    """Test suite for init-axiom.sh script."""
+    
+    @pytest.fixture(autouse=True)
+    def _workspace(self, tmp_path, monkeypatch):
+        """Run each test from its own tmp_path; monkeypatch restores the cwd."""
+        monkeypatch.chdir(tmp_path)
+        self.test_dir = tmp_path
+    
+    def run_init_script(self, entry_point="port", skip_scan=False):
+        """Initialize the test directory and return its InitResult."""
+        return init_project(self.test_dir, entry_point, skip_scan=skip_scan)
     
-    def test_successful_initialization(self):
+    def test_successful_initialization(self, entry_point):
         """Test successful initialization of axiom protocol."""
-        # Create a basic project structure
-        os.chdir(self.test_dir)
-        
         # Create some initial files
         with open("README.md", "w") as f:
             f.write("# Test Project")
@@ -62,367 +173,240 @@ class TestInitAxiomScript:
             f.write("def main():\n    print('Hello, World!')")
         
         # Run the init script
-        result = self.run_init_script()
+        result = self.run_init_script(entry_point)
         
         # Check that script succeeded
         assert result.returncode == 0, f"Script failed with: {result.stderr}"
+        assert "Axiom Protocol initialized successfully!" in result.stdout
         
-        # Check that expected files were created
-        assert Path(".axiom-manifest.yml").exists()
-        assert Path(".claude/commands").exists()
-        assert Path(".claude/commands/generate-prp.md").exists()
-        assert Path(".claude/commands/generate-prp-pro.md").exists()
-        assert Path(".claude/commands/execute-prp.md").exists()
-        assert Path("CLAUDE.md").exists()
-        assert Path("scripts/axiom-meta-generator.py").exists()
-        
-        # Check .axiom directory structure
-        assert Path(".axiom").exists()
-        assert Path(".axiom/meta").exists()
-        assert Path(".axiom/cache").exists()
-        assert Path(".axiom/index.yml").exists()
+        # Check that expected files were created, including the initial metadata scan output
+        assert_tree(self.test_dir, EXPECTED_CORE_FILES + (
+            ".axiom/meta/src/main.py.yml",
+            ".axiom/meta/README.md.yml",
+        ))
         
         # Check that .gitignore was updated
-        with open(".gitignore", "r") as f:
-            gitignore_content = f.read()
-        
-        assert ".axiom-manifest.yml" in gitignore_content
-        assert "*.contract.yml" in gitignore_content
-        assert ".axiom/" in gitignore_content
-        
-        # Check that initial metadata scan was performed
-        assert Path(".axiom/meta/src/main.py.yml").exists()
-        assert Path(".axiom/meta/README.md.yml").exists()
+        missing = missing_substrings(".gitignore", (b".axiom-manifest.yml", b"*.contract.yml", b".axiom/"))
+        assert not missing, f".gitignore is missing entries: {missing}"
         
         # Verify script permissions
         script_copy = Path("scripts/axiom-meta-generator.py")
         assert os.access(script_copy, os.X_OK), "Script should be executable"
     
-    def test_already_initialized_project(self):
+    def test_already_initialized_project(self, entry_point):
         """Test behavior when project is already initialized."""
-        os.chdir(self.test_dir)
-        
         # Create manifest file to simulate already initialized project
         with open(".axiom-manifest.yml", "w") as f:
             f.write("version: '1.0'\n")
         
         # Run the init script
-        result = self.run_init_script()
+        result = self.run_init_script(entry_point)
         
         # Check that script failed with appropriate error
         assert result.returncode == 1
         assert "already exists" in result.stderr
     
-    def test_no_gitignore_file(self):
+    def test_no_gitignore_file(self, entry_point, monkeypatch):
         """Test initialization when no .gitignore file exists."""
-        os.chdir(self.test_dir)
-        
         # Create basic files but no .gitignore
         with open("README.md", "w") as f:
             f.write("# Test Project")
         
-        # Run the init script
-        result = self.run_init_script()
+        # Run the init script; nothing here looks at meta files, so skip the scan
+        monkeypatch.setenv("AXIOM_SKIP_INITIAL_SCAN", "1")
+        result = self.run_init_script(entry_point)
         
         # Check that script succeeded
         assert result.returncode == 0
+        assert "AXIOM_SKIP_INITIAL_SCAN is set" in result.stdout
         
         # Check that expected files were created
-        assert Path(".axiom-manifest.yml").exists()
-        assert Path(".axiom").exists()
+        assert_tree(self.test_dir, (".axiom-manifest.yml", ".axiom"))
         
         # .gitignore should not exist (script shouldn't create it)
-        assert not Path(".gitignore").exists()
+        assert not (self.test_dir / ".gitignore").exists()
     
-    def test_no_python_available(self):
+    def test_no_python_available(self, no_python_path):
         """Test initialization when Python is not available."""
-        os.chdir(self.test_dir)
-        
         # Create basic files
         with open("README.md", "w") as f:
             f.write("# Test Project")
         
-        # Mock environment without Python
-        env = os.environ.copy()
-        env['PATH'] = '/usr/bin:/bin'  # Minimal PATH without Python
-        
-        # Run the init script with limited PATH
-        result = subprocess.run(
-            [str(self.script_path)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env=env
-        )
+        result = init_project(self.test_dir, "shell", path=no_python_path)
         
         # Script should still succeed but skip metadata scan
-        assert result.returncode == 0
-        assert "Python3 not found" in result.stderr or "Skipping initial scan" in result.stderr
+        assert result.returncode == 0, f"Script failed with: {result.stderr}"
+        assert "Python3 not found" in result.stdout
         
         # Basic structure should still be created
-        assert Path(".axiom-manifest.yml").exists()
-        assert Path(".axiom").exists()
-        assert Path("scripts/axiom-meta-generator.py").exists()
+        assert_tree(self.test_dir, (".axiom-manifest.yml", ".axiom", "scripts/axiom-meta-generator.py"))
+        assert not (self.test_dir / ".axiom" / "index.yml").exists()
     
-    def test_manifest_template_content(self):
-        """Test that manifest template is properly customized."""
-        os.chdir(self.test_dir)
+    def test_port_without_meta_generator(self, monkeypatch):
+        """Test that the port skips the scan when the meta generator is missing."""
+        monkeypatch.setattr(axiom_init, "META_GENERATOR_SCRIPT", self.test_dir / "missing-generator.py")
         
-        # Run the init script
         result = self.run_init_script()
-        assert result.returncode == 0
-        
-        # Check manifest content
-        with open(".axiom-manifest.yml", "r") as f:
-            manifest_content = f.read()
         
-        # Should contain template structure
-        assert "version: \"1.0\"" in manifest_content
-        assert "project:" in manifest_content
-        assert "commands:" in manifest_content
-        assert "architecture:" in manifest_content
-        assert "policies:" in manifest_content
-    
-    def test_claude_commands_copied(self):
-        """Test that Claude commands are properly copied."""
-        os.chdir(self.test_dir)
-        
-        # Run the init script
-        result = self.run_init_script()
         assert result.returncode == 0
-        
-        # Check that all command files exist
-        commands_dir = Path(".claude/commands")
-        assert commands_dir.exists()
-        
-        expected_commands = [
-            "generate-prp.md",
-            "generate-prp-pro.md", 
-            "execute-prp.md"
-        ]
-        
-        for command in expected_commands:
-            command_file = commands_dir / command
-            assert command_file.exists(), f"Command file {command} not found"
-            
-            # Check that files have content
-            assert command_file.stat().st_size > 0, f"Command file {command} is empty"
+        assert "Python3 not found or meta generator missing" in result.stdout
+        assert_tree(self.test_dir, (".axiom-manifest.yml", ".axiom"))
+        assert not (self.test_dir / "scripts" / "axiom-meta-generator.py").exists()
+        assert not (self.test_dir / ".axiom" / "index.yml").exists()
+
+    def test_port_skips_hidden_commands_like_cp(self, monkeypatch, tmp_path_factory):
+        """Test that the port copies commands the way cp -r dir/* does."""
+        commands = tmp_path_factory.mktemp("commands")
+        (commands / "visible.md").write_text("# Visible")
+        (commands / ".hidden.md").write_text("# Hidden")
+        (commands / "nested").mkdir()
+        (commands / "nested" / ".kept.md").write_text("# Kept")
+        monkeypatch.setattr(axiom_init, "CLAUDE_COMMANDS_DIR", commands)
+        monkeypatch.setenv("AXIOM_SKIP_INITIAL_SCAN", "1")
+        
+        assert self.run_init_script().returncode == 0
+        
+        copied = collect_tree(self.test_dir / ".claude" / "commands")
+        assert copied == {"visible.md", "nested", "nested/.kept.md"}
+
+
+class InitializedWorkspace(NamedTuple):
+    """A project initialized once and shared by the read-only tests below."""
+    root: Path
+    returncode: int
+    output: str
+
+
+@pytest.fixture(scope="module", params=ENTRY_POINTS)
+def initialized_workspace(request, tmp_path_factory):
+    """Initialize an empty project once per entry point, recording its exit code and messages."""
+    root = tmp_path_factory.mktemp(f"initialized-{request.param}")
+    result = init_project(root, request.param)
+    return InitializedWorkspace(root, result.returncode, result.stdout + result.stderr)
+
+
+@pytest.mark.parametrize("expected_path", EXPECTED_CORE_FILES, ids=str)
+def test_core_file_exists(initialized_workspace, expected_path):
+    """Test that each core path exists after a default initialization."""
+    assert initialized_workspace.returncode == 0
+    assert (initialized_workspace.root / expected_path).exists(), f"Expected path {expected_path} not found"
+
+
+def test_manifest_template_content(initialized_workspace):
+    """Test that manifest template is properly customized."""
+    assert initialized_workspace.returncode == 0
     
-    def test_claude_md_template_copied(self):
-        """Test that CLAUDE.md template is properly copied."""
-        os.chdir(self.test_dir)
-        
-        # Run the init script
-        result = self.run_init_script()
-        assert result.returncode == 0
-        
-        # Check that CLAUDE.md exists
-        claude_md = Path("CLAUDE.md")
-        assert claude_md.exists()
-        
-        # Check content
-        with open(claude_md, "r") as f:
-            content = f.read()
-        
-        assert "AI-Native Development Guidelines" in content
-        assert "Axiom Protocol" in content
-        assert "meta information" in content
+    # Check manifest content; should contain template structure
+    missing = missing_substrings(initialized_workspace.root / ".axiom-manifest.yml", (
+        b'version: "1.0"',
+        b"project:",
+        b"commands:",
+        b"architecture:",
+        b"policies:",
+    ))
+    assert not missing, f"Manifest is missing template structure: {missing}"
+
+
+@pytest.mark.parametrize("command", ["generate-prp.md", "generate-prp-pro.md", "execute-prp.md"])
+def test_claude_commands_copied(initialized_workspace, template_sources, command):
+    """Test that Claude commands are properly copied."""
+    assert initialized_workspace.returncode == 0
     
-    def test_script_output_messages(self):
-        """Test that script provides informative output messages."""
-        os.chdir(self.test_dir)
-        
-        # Run the init script
-        result = self.run_init_script()
-        assert result.returncode == 0
-        
-        # Check for expected output messages
-        combined_output = result.stdout + result.stderr
-        
-        assert "Initializing Axiom Protocol" in combined_output
-        assert "Axiom Protocol initialized successfully!" in combined_output
-        assert "Next steps:" in combined_output
-        assert "Directory structure created:" in combined_output
+    command_file = initialized_workspace.root / ".claude" / "commands" / command
+    assert command_file.exists(), f"Command file {command} not found"
     
-    def test_file_permissions(self):
-        """Test that created files have appropriate permissions."""
-        os.chdir(self.test_dir)
-        
-        # Run the init script
-        result = self.run_init_script()
-        assert result.returncode == 0
-        
-        # Check script permissions
-        script_file = Path("scripts/axiom-meta-generator.py")
-        assert script_file.exists()
-        assert os.access(script_file, os.X_OK), "Meta generator should be executable"
-        
-        # Check that other files are readable
-        assert os.access(".axiom-manifest.yml", os.R_OK)
-        assert os.access("CLAUDE.md", os.R_OK)
-        assert os.access(".axiom/index.yml", os.R_OK)
+    # Check that files have content, byte for byte the repo's command
+    source = template_sources[f".claude/commands/{command}"]
+    assert source, f"Command file {command} is empty"
+    assert command_file.read_bytes() == source, f"Command file {command} differs from its source"
+
+
+def test_claude_md_template_copied(initialized_workspace, template_sources):
+    """Test that CLAUDE.md template is properly copied."""
+    assert initialized_workspace.returncode == 0
+    
+    # Check that CLAUDE.md exists and matches the template
+    claude_md = initialized_workspace.root / "CLAUDE.md"
+    assert claude_md.exists()
+    content = template_sources["CLAUDE.md"]
+    assert claude_md.read_bytes() == content
+    
+    # Check content
+    assert b"AI-Native Development Guidelines" in content
+    assert b"Axiom Protocol" in content
+    assert b"meta information" in content
+
+
+def test_script_output_messages(initialized_workspace):
+    """Test that script provides informative output messages."""
+    assert initialized_workspace.returncode == 0
+    
+    # Check for expected output messages
+    combined_output = initialized_workspace.output
+    
+    assert "Initializing Axiom Protocol" in combined_output
+    assert "Axiom Protocol initialized successfully!" in combined_output
+    assert "Next steps:" in combined_output
+    assert "Directory structure created:" in combined_output
+
+
+def test_file_permissions(initialized_workspace):
+    """Test that created files have appropriate permissions."""
+    assert initialized_workspace.returncode == 0
+    root = initialized_workspace.root
+    
+    # Check script permissions
+    script_file = root / "scripts" / "axiom-meta-generator.py"
+    assert script_file.exists()
+    assert os.access(script_file, os.X_OK), "Meta generator should be executable"
+    
+    # Check that other files are readable
+    assert os.access(root / ".axiom-manifest.yml", os.R_OK)
+    assert os.access(root / "CLAUDE.md", os.R_OK)
+    assert os.access(root / ".axiom" / "index.yml", os.R_OK)
 
 
+@pytest.mark.slow
 class TestInitAxiomScriptIntegration:
     """Integration tests for init-axiom.sh script with real projects."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        self.script_path = Path(__file__).parent.parent / "init-axiom.sh"
-        
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        os.chdir(self.original_cwd)
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    @pytest.fixture(autouse=True)
+    def _workspace(self, tmp_path, monkeypatch):
+        """Run each test from its own tmp_path; monkeypatch restores the cwd."""
+        monkeypatch.chdir(tmp_path)
+        self.test_dir = tmp_path
     
-    def test_python_project_initialization(self):
+    def test_python_project_initialization(self, entry_point):
         """Test initialization of a Python project."""
-        os.chdir(self.test_dir)
-        
-        # Create a realistic Python project structure
-        directories = ["src", "tests", "docs"]
-        for directory in directories:
-            Path(directory).mkdir(exist_ok=True)
-        
-        # Create Python files
-        python_files = {
-            "src/__init__.py": "",
-            "src/main.py": "def main():\n    print('Hello, World!')\n\nif __name__ == '__main__':\n    main()",
-            "src/utils.py": "import os\nfrom pathlib import Path\n\ndef get_project_root():\n    return Path(__file__).parent.parent",
-            "tests/__init__.py": "",
-            "tests/test_main.py": "import pytest\nfrom src.main import main\n\ndef test_main():\n    assert main() is None",
-            "tests/test_utils.py": "from src.utils import get_project_root\n\ndef test_get_project_root():\n    assert get_project_root().exists()"
-        }
-        
-        for file_path, content in python_files.items():
-            file_obj = Path(file_path)
-            file_obj.parent.mkdir(parents=True, exist_ok=True)
-            file_obj.write_text(content)
-        
-        # Create config files
-        with open("requirements.txt", "w") as f:
-            f.write("pytest>=6.0.0\npytest-cov>=2.0.0\n")
-        
-        with open("setup.py", "w") as f:
-            f.write("from setuptools import setup, find_packages\n\nsetup(\n    name='test-project',\n    version='0.1.0',\n    packages=find_packages(),\n)")
-        
-        with open("README.md", "w") as f:
-            f.write("# Test Python Project\n\nThis is a test project for axiom protocol integration.")
-        
-        with open(".gitignore", "w") as f:
-            f.write("__pycache__/\n*.pyc\n.pytest_cache/\nvenv/\n.env\n")
+        # tests/fixtures/python_project: one source and one test file cover the Python scan paths
+        shutil.copytree(FIXTURE_DIR / "python_project", self.test_dir, dirs_exist_ok=True)
         
         # Run the init script
-        result = subprocess.run(
-            [str(self.script_path)],
-            capture_output=True,
-            text=True,
-            timeout=60  # Longer timeout for real project
-        )
+        result = init_project(self.test_dir, entry_point)
         
         # Check success
         assert result.returncode == 0, f"Script failed with: {result.stderr}"
         
-        # Verify all expected files were created
-        expected_files = [
-            ".axiom-manifest.yml",
-            "CLAUDE.md",
-            "scripts/axiom-meta-generator.py",
-            ".axiom/index.yml"
-        ]
-        
-        for file_path in expected_files:
-            assert Path(file_path).exists(), f"Expected file {file_path} not found"
-        
-        # Verify metadata was generated for Python files
-        expected_meta_files = [
-            ".axiom/meta/src/main.py.yml",
-            ".axiom/meta/src/utils.py.yml", 
-            ".axiom/meta/tests/test_main.py.yml",
-            ".axiom/meta/tests/test_utils.py.yml",
-            ".axiom/meta/README.md.yml"
-        ]
-        
-        for meta_file in expected_meta_files:
-            assert Path(meta_file).exists(), f"Expected meta file {meta_file} not found"
+        # Verify all expected files and the Python files' metadata were created
+        assert_tree(self.test_dir, EXPECTED_CORE_FILES + EXPECTED_PY_META)
         
         # Check .gitignore was updated
-        with open(".gitignore", "r") as f:
-            gitignore_content = f.read()
-        
-        assert ".axiom/" in gitignore_content
-        assert "*.contract.yml" in gitignore_content
+        missing = missing_substrings(".gitignore", (b".axiom/", b"*.contract.yml"))
+        assert not missing, f".gitignore is missing entries: {missing}"
     
-    def test_javascript_project_initialization(self):
+    def test_javascript_project_initialization(self, entry_point):
         """Test initialization of a JavaScript project."""
-        os.chdir(self.test_dir)
-        
-        # Create JavaScript project structure
-        directories = ["src", "tests", "public"]
-        for directory in directories:
-            Path(directory).mkdir(exist_ok=True)
-        
-        # Create JavaScript files
-        js_files = {
-            "src/index.js": "console.log('Hello, World!');\n\nfunction main() {\n    console.log('Application started');\n}\n\nmain();",
-            "src/utils.js": "export function formatDate(date) {\n    return date.toISOString();\n}\n\nexport function validateEmail(email) {\n    return email.includes('@');\n}",
-            "tests/index.test.js": "import { formatDate, validateEmail } from '../src/utils.js';\n\ntest('formatDate works', () => {\n    expect(formatDate(new Date())).toBeDefined();\n});",
-            "public/index.html": "<!DOCTYPE html>\n<html>\n<head>\n    <title>Test App</title>\n</head>\n<body>\n    <h1>Test Application</h1>\n</body>\n</html>"
-        }
-        
-        for file_path, content in js_files.items():
-            file_obj = Path(file_path)
-            file_obj.parent.mkdir(parents=True, exist_ok=True)
-            file_obj.write_text(content)
-        
-        # Create package.json
-        with open("package.json", "w") as f:
-            f.write('''{
-  "name": "test-project",
-  "version": "1.0.0",
-  "description": "Test project for axiom protocol",
-  "main": "src/index.js",
-  "scripts": {
-    "test": "jest",
-    "start": "node src/index.js"
-  },
-  "dependencies": {},
-  "devDependencies": {
-    "jest": "^27.0.0"
-  }
-}''')
-        
-        with open("README.md", "w") as f:
-            f.write("# Test JavaScript Project\n\nThis is a test JavaScript project for axiom protocol integration.")
-        
-        with open(".gitignore", "w") as f:
-            f.write("node_modules/\n*.log\n.env\n")
+        # tests/fixtures/js_project: one source and one test file cover the JavaScript scan paths
+        shutil.copytree(FIXTURE_DIR / "js_project", self.test_dir, dirs_exist_ok=True)
         
         # Run the init script
-        result = subprocess.run(
-            [str(self.script_path)],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = init_project(self.test_dir, entry_point)
         
         # Check success
         assert result.returncode == 0, f"Script failed with: {result.stderr}"
         
         # Verify metadata was generated for JavaScript files
-        expected_meta_files = [
-            ".axiom/meta/src/index.js.yml",
-            ".axiom/meta/src/utils.js.yml",
-            ".axiom/meta/tests/index.test.js.yml",
-            ".axiom/meta/package.json.yml",
-            ".axiom/meta/README.md.yml"
-        ]
-        
-        for meta_file in expected_meta_files:
-            assert Path(meta_file).exists(), f"Expected meta file {meta_file} not found"
+        assert_tree(self.test_dir, EXPECTED_JS_META)
 
 
 if __name__ == "__main__":